@@ -11,10 +11,11 @@ from __future__ import annotations
 import os
 
 from aqt import mw
-from aqt.gui_hooks import reviewer_did_answer_card
-from aqt.qt import QAction
+from aqt.gui_hooks import profile_will_close, reviewer_did_answer_card
+from aqt.qt import QAction, QTimer
 from aqt.utils import qconnect
 
+from .constants import SAVE_DEBOUNCE_MS
 from .state import AddonState
 from .tracker import StreakTracker
 from .ui import GardenDialog
@@ -29,6 +30,8 @@ _BASE_DIR = os.path.dirname(__file__)
 # Persistent state.
 addon_state = AddonState(base_dir=_BASE_DIR)
 addon_state.load()
+# Debounce saves on the Qt event loop; profile close flushes anything pending.
+addon_state.set_write_scheduler(lambda write: QTimer.singleShot(SAVE_DEBOUNCE_MS, write))
 
 # Per-session streak tracker.
 streak_tracker = StreakTracker(state=addon_state)
@@ -45,6 +48,16 @@ def _on_reviewer_did_answer_card(reviewer, card, ease: int) -> None:
         return
 
 
+def _on_profile_will_close() -> None:
+    """Hook callback for when the profile is closing: make the save durable."""
+
+    try:
+        addon_state.flush_to_disk()
+    except Exception:
+        # Never block Anki from closing the profile.
+        return
+
+
 def _open_garden_dialog() -> None:
     """Open the garden dialog."""
 
@@ -69,6 +82,7 @@ def init_ankigarden() -> None:
 
     _setup_menu()
     reviewer_did_answer_card.append(_on_reviewer_did_answer_card)
+    profile_will_close.append(_on_profile_will_close)
 
 
 # Initialize on import.
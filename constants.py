@@ -54,6 +54,8 @@ THEME_UNLOCK_PRICE = 2000
 
 # Persistence / schema
 STATE_FILENAME = "ankigarden_state.json"
-CURRENT_SCHEMA_VERSION = 1
+CURRENT_SCHEMA_VERSION = 2
+# Saves requested within this window are coalesced into one write.
+SAVE_DEBOUNCE_MS = 500
 
 
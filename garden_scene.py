@@ -17,6 +17,7 @@ from aqt.qt import (
     QEasingCurve,
     QGraphicsEllipseItem,
     QGraphicsItem,
+    QGraphicsItemGroup,
     QGraphicsObject,
     QGraphicsScene,
     QGraphicsView,
@@ -80,6 +81,7 @@ class GardenItem(QGraphicsObject):
         kind: str,
         tile_idx: Optional[int] = None,
         tile: Optional[dict] = None,
+        status: Optional[TileStatus] = None,
         parent=None,
     ):
         super().__init__(parent)
@@ -93,7 +95,9 @@ class GardenItem(QGraphicsObject):
         self.setAcceptHoverEvents(True)
         self._start_pos: QPointF = QPointF()
         self._start_idx: Optional[int] = tile_idx
-        self.status: TileStatus = self.state.tile_status(tile, utc_now())
+        self.status: TileStatus = (
+            status if status is not None else self.state.tile_status(tile, utc_now())
+        )
     
     def _get_mode_adjusted_color(self, base_color: QColor, mode: str) -> QColor:
         """Adjust a color based on the aesthetic mode."""
@@ -1599,19 +1603,10 @@ class GardenScene(QGraphicsScene):
     def refresh_items(self) -> None:
         try:
             self.clear_items()
-            tiles = self.state.get_tiles()
-            now = utc_now()
             processed_indices = set()  # Track which tiles we've already processed (for 2x2 trees/cherry blossoms)
             
-            # First pass: check for evolution
-            for idx, tile in enumerate(tiles):
-                if tile is None:
-                    continue
-                # Skip reference tiles (part of 2x2 cherry blossoms)
-                if tile.get("is_reference"):
-                    continue
-                # Check and perform evolution if needed
-                self.state._evolve_tile_if_needed(tile, idx)
+            # First pass: evolve tiles and compute every status against one clock read
+            statuses = self.state.evolve_and_status_all()
             
             # Reload tiles after evolution
             tiles = self.state.get_tiles()
@@ -1624,7 +1619,7 @@ class GardenScene(QGraphicsScene):
                 if tile.get("is_reference"):
                     continue
                     
-                status = self.state.tile_status(tile, now)
+                status = statuses[idx]
                 row, col = self.state.index_to_row_col(idx)
                 kind = tile.get("kind") or "plant"
                 
@@ -1647,8 +1642,9 @@ class GardenScene(QGraphicsScene):
                         col * TILE_SIZE + TILE_SIZE / 2, row * TILE_SIZE + TILE_SIZE / 2
                     )
                 
-                item = GardenItem(state=self.state, kind=kind, tile_idx=idx, tile=tile)
-                item.status = status
+                item = GardenItem(
+                    state=self.state, kind=kind, tile_idx=idx, tile=tile, status=status
+                )
                 item.setPos(pos)
                 self.addItem(item)
                 self.items_by_idx[idx] = item
@@ -2013,32 +2009,28 @@ class GardenScene(QGraphicsScene):
         self._hover_tile_row = row
         self._hover_tile_col = col
         
+        state = self.state
+        
         # Check if this is a tree/cherry_blossom (2x2) or plant/seed/colorful_plant (1x1)
-        idx = self.state.row_col_to_index(row, col)
+        idx = state.row_col_to_index(row, col)
         if idx is None:
             return
         
-        tiles = self.state.get_tiles()
+        tiles = state.get_tiles()
         if idx >= len(tiles) or tiles[idx] is None:
             return
         
-        tile = tiles[idx]
         # Skip reference tiles, find the main tile
-        if tile.get("is_reference"):
-            main_id = tile.get("id")
-            for t in tiles:
-                if t is not None and t.get("id") == main_id and not t.get("is_reference"):
-                    tile = t
-                    break
+        tile = tiles[state._main_tile_index(idx)]
         
         kind = tile.get("kind")
         
         # For trees and cherry blossoms, find the top-left tile
         if kind in ("tree", "cherry_blossom"):
-            tree_idx = self.state._find_tree_at_tile(row, col)
+            tree_idx = state._find_tree_at_tile(row, col)
             if tree_idx is None:
                 return
-            tree_row, tree_col = self.state.index_to_row_col(tree_idx)
+            tree_row, tree_col = state.index_to_row_col(tree_idx)
             # Highlight all 4 tiles
             for dr in range(2):
                 for dc in range(2):
@@ -2087,6 +2079,10 @@ class GardenScene(QGraphicsScene):
     def mousePressEvent(self, event) -> None:  # type: ignore[override]
         """Handle mouse clicks for watering mode, path placement, and object removal."""
         try:
+            state = self.state
+            row_col_to_index = state.row_col_to_index
+            find_tree = state._find_tree_at_tile
+            
             scene_pos = event.scenePos()
             row = int(scene_pos.y() // TILE_SIZE)
             col = int(scene_pos.x() // TILE_SIZE)
@@ -2113,7 +2109,7 @@ class GardenScene(QGraphicsScene):
                     self._bottom_left_clicks = 0
                     if self._bottom_right_clicks >= 10:
                         self._bottom_right_clicks = 0
-                        self.state.award_token("coins", 20000)
+                        state.award_token("coins", 20000)
                         parent = self.views()[0] if self.views() else None
                         tooltip("You received 20000 coins!", parent=parent)
                         self.stateChanged.emit()
@@ -2144,10 +2140,8 @@ class GardenScene(QGraphicsScene):
                 
                 if direction:
                     # Try to remove path at this edge
-                    paths = self.state.get_paths()
-                    path_key = (row, col, direction)
-                    if path_key in paths:
-                        success = self.state.remove_path(row, col, direction)
+                    if state.has_path(row, col, direction):
+                        success = state.remove_path(row, col, direction)
                         parent = self.views()[0] if self.views() else None
                         if success:
                             tooltip("Path removed and returned to inventory.", parent=parent)
@@ -2158,20 +2152,20 @@ class GardenScene(QGraphicsScene):
                         return
                 
                 # If no path found, try to remove object at clicked position
-                idx = self.state.row_col_to_index(row, col)
+                idx = row_col_to_index(row, col)
                 if idx is not None:
                     # Check if there's an item at this position
-                    tiles = self.state.get_tiles()
+                    tiles = state.get_tiles()
                     tile = tiles[idx] if idx < len(tiles) else None
                     if tile is not None and not tile.get("is_reference"):
                         # Find the actual item (might be part of 2x2 tree/cherry blossom)
                         if tile.get("kind") in ("tree", "cherry_blossom"):
                             # Find top-left tile
-                            top_left_idx = self.state._find_tree_at_tile(row, col)
+                            top_left_idx = find_tree(row, col)
                             if top_left_idx is not None:
                                 idx = top_left_idx
                         
-                        success, message = self.state.remove_object_at_index(idx)
+                        success, message = state.remove_object_at_index(idx)
                         parent = self.views()[0] if self.views() else None
                         tooltip(message, parent=parent)
                         if success:
@@ -2196,7 +2190,7 @@ class GardenScene(QGraphicsScene):
                     direction = "w"  # West edge
                 
                 if direction:
-                    success, message = self.state.place_path(row, col, direction)
+                    success, message = state.place_path(row, col, direction)
                     parent = self.views()[0] if self.views() else None
                     tooltip(message, parent=parent)
                     if success:
@@ -2209,20 +2203,20 @@ class GardenScene(QGraphicsScene):
             
             if self._watering_mode:
                 # Water the tile
-                success, message = self.state.water_tile(row, col)
+                success, message = state.water_tile(row, col)
                 
                 parent = self.views()[0] if self.views() else None
                 tooltip(message, parent=parent)
                 
                 if success:
                     # Find the item to animate
-                    idx = self.state.row_col_to_index(row, col)
+                    idx = row_col_to_index(row, col)
                     item = None
                     if idx is not None and idx in self.items_by_idx:
                         item = self.items_by_idx[idx]
                         # For trees and cherry blossoms, find the actual item
                         if item.tile is not None and item.tile.get("kind") in ("tree", "cherry_blossom"):
-                            tree_idx = self.state._find_tree_at_tile(row, col)
+                            tree_idx = find_tree(row, col)
                             if tree_idx is not None and tree_idx in self.items_by_idx:
                                 item = self.items_by_idx[tree_idx]
                     
@@ -2243,44 +2237,51 @@ class GardenScene(QGraphicsScene):
     def _create_water_splash(self, pos: QPointF, item: Optional[GardenItem]) -> None:
         """Create a visual water splash effect at the given position."""
         try:
-            # Create multiple water droplets
+            # Create multiple water droplets, grouped so the scene tracks them as one item
+            group = QGraphicsItemGroup()
+            group.setZValue(100)  # Above everything
+            self.addItem(group)
+
+            droplets = []
             for i in range(8):
                 droplet = QGraphicsEllipseItem(0, 0, 6, 6)
                 droplet.setBrush(QColor(173, 216, 230, 200))  # Light blue
                 droplet.setPen(QPen(Qt.PenStyle.NoPen))
                 droplet.setPos(pos)
-                droplet.setZValue(100)  # Above everything
-                self.addItem(droplet)
-                
-                # Animate droplet
-                anim = QVariantAnimation()
-                anim.setDuration(400)
-                anim.setStartValue(0.0)
-                anim.setEndValue(1.0)
-                anim.setEasingCurve(QEasingCurve.Type.OutQuad)
-                
+                group.addToGroup(droplet)
+
                 # Random direction for each droplet
                 angle = (i * 45) * math.pi / 180  # 8 droplets in circle
                 distance = 30 + (i % 3) * 10  # Varying distances
-                
-                def update(value, drop=droplet, a=angle, d=distance):
-                    progress = float(value)
+                droplets.append((droplet, angle, distance))
+
+            # Animate all droplets with a single animation
+            anim = QVariantAnimation()
+            anim.setDuration(400)
+            anim.setStartValue(0.0)
+            anim.setEndValue(1.0)
+            anim.setEasingCurve(QEasingCurve.Type.OutQuad)
+
+            def update(value):
+                progress = float(value)
+                # Fade out
+                color = QColor(173, 216, 230, int(200 * (1 - progress)))
+                for drop, a, d in droplets:
                     x = pos.x() + d * progress * math.cos(a)
                     y = pos.y() + d * progress * math.sin(a)
                     drop.setPos(x - 3, y - 3)
-                    # Fade out
-                    alpha = int(200 * (1 - progress))
-                    drop.setBrush(QColor(173, 216, 230, alpha))
-                
-                anim.valueChanged.connect(update)  # type: ignore[arg-type]
-                
-                def remove_droplet(drop=droplet):
-                    self.removeItem(drop)
-                
-                anim.finished.connect(remove_droplet)
-                anim.start()
-                self._animations.append(anim)
-            
+                    drop.setBrush(color)
+
+            anim.valueChanged.connect(update)  # type: ignore[arg-type]
+
+            def remove_droplets(grp=group):
+                # Removing the group removes all of its droplets in one call
+                self.removeItem(grp)
+
+            anim.finished.connect(remove_droplets)
+            anim.start()
+            self._animations.append(anim)
+
             # Also animate the item itself (scale + color flash)
             if item is not None:
                 # Scale animation
@@ -2324,7 +2325,8 @@ class GardenView(QGraphicsView):
             int(GARDEN_WIDTH * TILE_SIZE + 8), int(GARDEN_HEIGHT * TILE_SIZE + 8)
         )
         self.garden_scene = GardenScene(state, self)
-        self.garden_scene.stateChanged.connect(self.stateChanged.emit)
+        # Signal-to-signal connection: forwarded in C++ without a Python call.
+        self.garden_scene.stateChanged.connect(self.stateChanged)
         self.setScene(self.garden_scene)
     
     def set_dialog_reference(self, dialog) -> None:
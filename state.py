@@ -6,12 +6,15 @@ Includes basic schema versioning to allow future migrations.
 
 from __future__ import annotations
 
+import heapq
 import json
+import logging
 import os
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 import random
 
@@ -26,8 +29,46 @@ from .constants import (
     STATE_FILENAME,
 )
 
+try:
+    # orjson ships with Anki and serializes much faster than the stdlib.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the Anki build
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
 UTC = timezone.utc
 
+# O(1) membership test for inventory keys (INVENTORY_KEYS keeps the order).
+_INV_KEYS_SET = frozenset(INVENTORY_KEYS)
+
+# Flags for the temporary file written by `AddonState._safe_write`.
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _dumps(data: Any, pretty: bool = False) -> bytes:
+    """Serialize state to UTF-8 JSON bytes with sorted keys.
+
+    Output is compact unless `pretty` is set (2-space indent, for humans).
+    """
+
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes produced by `_dumps` (or any valid JSON)."""
+
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 def utc_now() -> datetime:
     """Return the current UTC time."""
@@ -35,17 +76,22 @@ def utc_now() -> datetime:
     return datetime.now(UTC)
 
 
-def to_iso(dt: datetime) -> str:
-    """Convert a datetime to an ISO 8601 string."""
+# Tile timestamps are stored as float UTC epoch seconds.
+SECONDS_PER_DAY = 86400.0
+
+
+def to_timestamp(dt: datetime) -> float:
+    """Convert a datetime to UTC epoch seconds (naive datetimes are UTC)."""
 
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=UTC)
-    return dt.astimezone(UTC).isoformat()
+    return dt.timestamp()
 
 
 def from_iso(s: str) -> Optional[datetime]:
     """Parse an ISO 8601 string to datetime.
 
+    Only needed to migrate schema 1 saves, which stored ISO strings.
     Returns None on failure.
     """
 
@@ -60,10 +106,54 @@ def from_iso(s: str) -> Optional[datetime]:
         return None
 
 
+# Random bytes for tile ids, refilled 64 ids at a time to amortize os.urandom.
+_uuid_pool = bytearray()
+
+
+def _new_uuid() -> str:
+    """Return a random (version 4) UUID string, like `str(uuid.uuid4())`."""
+
+    global _uuid_pool
+    if not _uuid_pool:
+        _uuid_pool = bytearray(os.urandom(16 * 64))
+    raw = bytes(_uuid_pool[-16:])
+    del _uuid_pool[-16:]
+    return str(uuid.UUID(bytes=raw, version=4))
+
+
+# Dead / wilt thresholds per tile kind, in days since last watered:
+# (dead after, heavy wilt (level 2) from, wilt from, wilt level at that stage).
+# - Plants: wilt level 1 at 1–2 days, level 2 (darker, more brown) at 2–3 days,
+#   dead after 3 days.
+# - Trees: wilted (no level) at 1–2 days, dead after 2 days.
+# - Seeds, colorful plants and cherry blossoms: wilt level 1 at 1–2 days,
+#   dead after 2 days.
+_WILT_TABLE: Dict[str, Tuple[float, Optional[float], float, int]] = {
+    "plant": (3, 2, 1, 1),
+    "tree": (2, None, 1, 0),
+    "seed": (2, None, 1, 1),
+    "colorful_plant": (2, None, 1, 1),
+    "cherry_blossom": (2, None, 1, 1),
+}
+
+# Evolution timings in seconds: tiles dry for longer than _EVOLVE_DRY_LIMIT
+# never evolve; seeds and colorful plants evolve after _EVOLVE_AFTER.
+_EVOLVE_DRY_LIMIT = 2 * SECONDS_PER_DAY
+_EVOLVE_AFTER = 7 * SECONDS_PER_DAY
+
+# The three tiles a 2x2 object covers besides its top-left tile, as
+# (index offset, row offset, col offset) in row-major order.
+_BLOCK_NEIGHBORS: Tuple[Tuple[int, int, int], ...] = (
+    (1, 0, 1),
+    (GARDEN_WIDTH, 1, 0),
+    (GARDEN_WIDTH + 1, 1, 1),
+)
+
+
 def default_inventory() -> Dict[str, int]:
     """Return a default inventory dict."""
 
-    return {k: 0 for k in INVENTORY_KEYS}
+    return dict.fromkeys(INVENTORY_KEYS, 0)
 
 
 def default_garden() -> Dict[str, Any]:
@@ -73,7 +163,7 @@ def default_garden() -> Dict[str, Any]:
         "width": GARDEN_WIDTH,
         "height": GARDEN_HEIGHT,
         # Flat list of tiles, row-major. Each entry is either None or a tile dict.
-        "tiles": [None for _ in range(GARDEN_WIDTH * GARDEN_HEIGHT)],
+        "tiles": [None] * (GARDEN_WIDTH * GARDEN_HEIGHT),
     }
 
 
@@ -99,16 +189,26 @@ def initial_state() -> Dict[str, Any]:
     }
 
 
-@dataclass
 class TileStatus:
-    """Represents the computed status for a tile."""
+    """Represents the computed status for a tile.
+
+    A plain slotted class rather than a dataclass: one is built per tile on
+    every garden refresh.
+    """
+
+    __slots__ = ("is_empty", "is_blooming", "is_wilted", "is_dead", "wilt_level")
+
+    def __init__(self) -> None:
+        self.is_empty: bool = True
+        self.is_blooming: bool = False
+        self.is_wilted: bool = False
+        self.is_dead: bool = False
+        # For plants only: 0 = not wilted, 1 = mildly wilted, 2 = heavily wilted.
+        self.wilt_level: int = 0
 
-    is_empty: bool = True
-    is_blooming: bool = False
-    is_wilted: bool = False
-    is_dead: bool = False
-    # For plants only: 0 = not wilted, 1 = mildly wilted, 2 = heavily wilted.
-    wilt_level: int = 0
+
+# Shared status for every empty tile (see `AddonState.tile_status`).
+_EMPTY_STATUS = TileStatus()
 
 
 @dataclass
@@ -117,6 +217,34 @@ class AddonState:
 
     base_dir: str
     data: Dict[str, Any] = field(default_factory=initial_state)
+    # Nesting depth of `batch()` blocks; saves are deferred while > 0.
+    _in_batch: int = field(default=0, init=False, repr=False)
+    # Set when a mutation has not been written to disk yet.
+    _dirty: bool = field(default=False, init=False, repr=False)
+    # Optional hook that runs a callback later (e.g. a Qt single-shot timer);
+    # when set, saves are debounced through it. See `set_write_scheduler`.
+    _schedule_write: Optional[Callable[[Callable[[], None]], None]] = field(
+        default=None, init=False, repr=False
+    )
+    # True while a debounced write is waiting on `_schedule_write`.
+    _write_scheduled: bool = field(default=False, init=False, repr=False)
+    # Hash of the last bytes written to disk, used to skip no-op saves.
+    _last_serialized_hash: Optional[int] = field(default=None, init=False, repr=False)
+    # Tile id -> indices of its reference tiles (the extra cells of a 2x2 object).
+    _id_to_ref_indices: Dict[str, List[int]] = field(default_factory=dict, init=False, repr=False)
+    # Tile id -> index of the main tile, for objects that have reference tiles.
+    _id_to_main_idx: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    # Min-heap of tile indices that were empty when pushed. Entries may be
+    # stale (filled since); `_first_empty_index` discards those lazily.
+    _empty_indices: List[int] = field(
+        default_factory=lambda: list(range(GARDEN_WIDTH * GARDEN_HEIGHT)), init=False, repr=False
+    )
+    # Membership index over data["paths"] (which stays the serialized list).
+    _paths_set: Set[Tuple[int, int, str]] = field(default_factory=set, init=False, repr=False)
+    # Membership index over data["unlocked_themes"] (the serialized list).
+    _unlocked_set: Set[str] = field(default_factory=lambda: {"default"}, init=False, repr=False)
+    # Normalized copy of the inventory; dropped by `_save()` after any mutation.
+    _inv_cache: Optional[Dict[str, int]] = field(default=None, init=False, repr=False)
 
     @property
     def path(self) -> str:
@@ -130,28 +258,27 @@ class AddonState:
     def load(self) -> None:
         """Load state from disk, creating a default file if necessary."""
 
-        if not os.path.exists(self.path):
-            self.data = initial_state()
-            self._save()
-            return
-
-        try:
-            with open(self.path, "r", encoding="utf-8") as f:
-                loaded = json.load(f)
-        except Exception:
-            # If the file is corrupt, fall back to a fresh state.
-            self.data = initial_state()
-            self._save()
-            return
-
-        if not isinstance(loaded, dict):
+        loaded: Any = None
+        # Hash of the bytes on disk; the save below is skipped when the
+        # canonical form is identical (the common case on startup).
+        self._last_serialized_hash = None
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, "rb") as f:
+                    raw = f.read()
+                loaded = _loads(raw)
+                self._last_serialized_hash = hash(raw)
+            except Exception:
+                # If the file is corrupt, fall back to a fresh state.
+                loaded = None
+
+        if isinstance(loaded, dict):
+            self.data = self._migrate(loaded)
+        else:
+            # Missing, corrupt or malformed file: start fresh.
             self.data = initial_state()
-            self._save()
-            return
-
-        self.data = self._migrate(loaded)
         self._ensure_defaults()
-        self._save()  # Save back in canonical format.
+        self._save()  # Save back in canonical format (no-op if unchanged).
 
     def _ensure_defaults(self) -> None:
         """Ensure required keys are present in the state."""
@@ -174,10 +301,21 @@ class AddonState:
         if "default" not in unlocked:
             unlocked.append("default")
             self.data["unlocked_themes"] = unlocked
+        self._unlocked_set = set(unlocked)
         
-        # Ensure paths list exists
-        if "paths" not in self.data:
-            self.data["paths"] = []
+        # Ensure paths list exists; JSON loads entries as lists, so normalize
+        # them to (row, col, direction) tuples and drop duplicates.
+        paths: List[Tuple[int, int, str]] = []
+        paths_set: Set[Tuple[int, int, str]] = set()
+        for entry in self.data.get("paths") or []:
+            if not isinstance(entry, (list, tuple)) or len(entry) != 3:
+                continue
+            key = (int(entry[0]), int(entry[1]), str(entry[2]))
+            if key not in paths_set:
+                paths_set.add(key)
+                paths.append(key)
+        self.data["paths"] = paths
+        self._paths_set = paths_set
 
         garden = self.data.setdefault("garden", {})
         old_w = int(garden.get("width", GARDEN_WIDTH))
@@ -194,61 +332,203 @@ class AddonState:
         # tiles in the overlapping top-left region instead of wiping.
         old_expected_len = max(old_w, 0) * max(old_h, 0)
         if len(tiles) != expected_len:
-            new_tiles: List[Optional[Dict[str, Any]]] = [None for _ in range(expected_len)]
+            new_tiles: List[Optional[Dict[str, Any]]] = [None] * expected_len
             if old_expected_len == len(tiles) and old_w > 0 and old_h > 0:
+                # Copy the overlapping part of each row with one slice assignment.
+                copy_w = min(old_w, GARDEN_WIDTH)
                 for r in range(min(old_h, GARDEN_HEIGHT)):
-                    for c in range(min(old_w, GARDEN_WIDTH)):
-                        old_idx = r * old_w + c
-                        new_idx = r * GARDEN_WIDTH + c
-                        if 0 <= old_idx < len(tiles) and 0 <= new_idx < len(new_tiles):
-                            new_tiles[new_idx] = tiles[old_idx]
+                    new_start = r * GARDEN_WIDTH
+                    old_start = r * old_w
+                    new_tiles[new_start:new_start + copy_w] = tiles[old_start:old_start + copy_w]
             else:
                 # Fallback: shallow copy as much as possible in row-major order.
-                for i in range(min(len(tiles), len(new_tiles))):
-                    new_tiles[i] = tiles[i]
+                n = min(len(tiles), len(new_tiles))
+                new_tiles[:n] = tiles[:n]
             tiles = new_tiles
             garden["tiles"] = tiles
 
-        # Ensure each tile dict carries row/col for persistence/debugging.
+        # Ensure each tile dict carries row/col for persistence/debugging,
+        # and index the main and reference tiles of 2x2 objects by id.
+        ref_indices: Dict[str, List[int]] = {}
+        main_indices: Dict[str, int] = {}
+        empty_indices: List[int] = []
         for idx, tile in enumerate(tiles):
-            if isinstance(tile, dict):
+            if tile is None:
+                empty_indices.append(idx)
+            elif isinstance(tile, dict):
                 row, col = divmod(idx, GARDEN_WIDTH)
                 tile.setdefault("row", row)
                 tile.setdefault("col", col)
+                if tile.get("is_reference"):
+                    ref_indices.setdefault(tile.get("id"), []).append(idx)
+                else:
+                    main_indices[tile.get("id")] = idx
+        self._id_to_ref_indices = ref_indices
+        self._id_to_main_idx = {
+            tid: main_indices[tid] for tid in ref_indices if tid in main_indices
+        }
+        # Built in ascending order, so it is already a valid heap.
+        self._empty_indices = empty_indices
 
     def _migrate(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Migrate a loaded state dict to the current schema version.
 
-        For now, only schema_version 1 is supported, but this method is
-        structured to allow future migration steps.
+        Version history:
+        - 1: tile timestamps stored as ISO 8601 strings.
+        - 2: tile timestamps stored as float UTC epoch seconds.
         """
 
         version = int(data.get("schema_version", 0))
+        if version == CURRENT_SCHEMA_VERSION:
+            return data
         if version < 1:
             # Treat anything older/unknown as fresh state for MVP.
             return initial_state()
 
+        if version < 2:
+            garden = data.get("garden")
+            tiles = garden.get("tiles") if isinstance(garden, dict) else None
+            for tile in tiles if isinstance(tiles, list) else ():
+                if not isinstance(tile, dict):
+                    continue
+                for key in ("planted_at", "last_watered_at", "bloom_until"):
+                    value = tile.get(key)
+                    if isinstance(value, str):
+                        dt = from_iso(value)
+                        tile[key] = dt.timestamp() if dt is not None else None
+
         # If we add future versions, incrementally migrate here.
         data["schema_version"] = CURRENT_SCHEMA_VERSION
         return data
 
-    def _safe_write(self, text: str) -> None:
-        """Safely write text to the state file using a temporary file."""
+    def _safe_write(self, data: bytes, fsync: bool = False) -> None:
+        """Safely write bytes to the state file using a temporary file.
+
+        `os.replace` keeps the write atomic if Anki crashes; `fsync=True`
+        additionally fsyncs so the data survives an OS crash or power loss.
+        """
 
         target = self.path
         tmp = target + ".tmp"
-        os.makedirs(os.path.dirname(target), exist_ok=True)
-        with open(tmp, "w", encoding="utf-8") as f:
-            f.write(text)
-            f.flush()
-            os.fsync(f.fileno())
+        # Unbuffered write of the whole payload; O_BINARY avoids newline
+        # translation on Windows.
+        try:
+            fd = os.open(tmp, _WRITE_FLAGS, 0o666)
+        except FileNotFoundError:
+            # The add-on folder normally exists; only create it when missing.
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            fd = os.open(tmp, _WRITE_FLAGS, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
         os.replace(tmp, target)
 
-    def _save(self) -> None:
-        """Persist current state to disk."""
+    def _mark_dirty(self) -> None:
+        """Record a mutation without writing; the next save or `flush()` writes it."""
+
+        # Every mutation ends up here, so this keeps the inventory cache fresh.
+        self._inv_cache = None
+        self._dirty = True
+
+    def _save(self, fsync: bool = False) -> None:
+        """Persist current state to disk.
+
+        Deferred while inside `batch()`, and debounced when a write scheduler
+        is installed. `fsync=True` writes and fsyncs immediately.
+        """
+
+        self._mark_dirty()
+        if fsync:
+            self._write(fsync=True)
+            return
+        if self._in_batch:
+            return
+        if self._schedule_write is not None:
+            if not self._write_scheduled:
+                self._write_scheduled = True
+                self._schedule_write(self._run_scheduled_write)
+            return
+        self._write()
+
+    def _run_scheduled_write(self) -> None:
+        """Callback for a debounced save.
+
+        Runs from the event loop, outside any caller's error handling, so a
+        failed write is logged rather than raised. The state stays dirty and
+        the next save (or `flush_to_disk()` on profile close) retries it.
+        """
+
+        self._write_scheduled = False
+        if self._dirty and not self._in_batch:
+            try:
+                self._write()
+            except Exception:
+                logger.exception("AnkiGarden: failed to save state to %s", self.path)
+
+    def set_write_scheduler(
+        self, schedule: Optional[Callable[[Callable[[], None]], None]]
+    ) -> None:
+        """Debounce saves through `schedule`, which must call its argument later.
+
+        Saves requested before the callback runs are coalesced into one write.
+        Pass None to write synchronously again.
+        """
+
+        self._schedule_write = schedule
+
+    def flush(self) -> None:
+        """Write any pending changes now (without fsync)."""
 
-        text = json.dumps(self.data, indent=2, sort_keys=True)
-        self._safe_write(text)
+        if self._dirty:
+            self._write()
+
+    def _write(self, fsync: bool = False) -> None:
+        """Serialize the current state and write it to disk.
+
+        The state stays dirty if the write raises, so a later save retries it.
+        """
+
+        data = _dumps(self.data)
+        h = hash(data)
+        if h == self._last_serialized_hash and not fsync:
+            # Nothing changed since the last write.
+            self._dirty = False
+            return
+        self._safe_write(data, fsync=fsync)
+        self._last_serialized_hash = h
+        self._dirty = False
+
+    def debug_dump(self, path: str) -> None:
+        """Write a pretty-printed copy of the state to `path` for debugging."""
+
+        with open(path, "wb") as f:
+            f.write(_dumps(self.data, pretty=True))
+
+    def flush_to_disk(self) -> None:
+        """Write the state and fsync it; used when the profile closes."""
+
+        self._save(fsync=True)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group several mutations into a single save.
+
+        Calls to `_save()` inside the block only mark the state dirty; the
+        outermost block writes once on exit if anything changed.
+        """
+
+        self._in_batch += 1
+        try:
+            yield
+        finally:
+            self._in_batch -= 1
+            if self._in_batch == 0 and self._dirty:
+                self._save()
 
     # ------------------------------------------------------------------
     # Convenience accessors
@@ -256,9 +536,11 @@ class AddonState:
     def get_inventory(self) -> Dict[str, int]:
         """Return a copy of the inventory dictionary."""
 
-        inv = self.data.get("inventory") or {}
+        if self._inv_cache is None:
+            inv = self.data.get("inventory") or {}
+            self._inv_cache = {k: int(inv.get(k, 0)) for k in INVENTORY_KEYS}
         # Return a shallow copy to avoid accidental external mutation.
-        return {k: int(inv.get(k, 0)) for k in INVENTORY_KEYS}
+        return self._inv_cache.copy()
 
     def get_garden_dims(self) -> Tuple[int, int]:
         """Return (width, height) of the garden."""
@@ -274,8 +556,11 @@ class AddonState:
         garden = self.data.get("garden") or {}
         tiles = garden.get("tiles")
         if not isinstance(tiles, list):
-            tiles = [None for _ in range(GARDEN_WIDTH * GARDEN_HEIGHT)]
+            tiles = [None] * (GARDEN_WIDTH * GARDEN_HEIGHT)
             garden["tiles"] = tiles
+            self._empty_indices = list(range(len(tiles)))
+            self._id_to_ref_indices = {}
+            self._id_to_main_idx = {}
         return tiles
     
     def get_aesthetic_mode(self) -> str:
@@ -290,8 +575,7 @@ class AddonState:
     
     def is_theme_unlocked(self, mode: str) -> bool:
         """Check if a theme is unlocked."""
-        unlocked = self.data.get("unlocked_themes", ["default"])
-        return mode in unlocked
+        return mode in self._unlocked_set
     
     def get_unlocked_themes(self) -> List[str]:
         """Return list of unlocked themes."""
@@ -299,6 +583,7 @@ class AddonState:
         # Ensure default is always unlocked
         if "default" not in unlocked:
             unlocked.append("default")
+            self._unlocked_set.add("default")
         return unlocked
     
     def unlock_theme(self, mode: str) -> tuple[bool, str]:
@@ -328,6 +613,7 @@ class AddonState:
         unlocked = self.data.get("unlocked_themes", ["default"])
         unlocked.append(mode)
         self.data["unlocked_themes"] = unlocked
+        self._unlocked_set.add(mode)
         self._save()
         return (True, f"Unlocked {mode.title()} theme for {THEME_UNLOCK_PRICE} coins!")
 
@@ -337,7 +623,7 @@ class AddonState:
     def award_token(self, key: str, amount: int = 1) -> None:
         """Add tokens to inventory for a particular key."""
 
-        if key not in INVENTORY_KEYS:
+        if key not in _INV_KEYS_SET:
             return
         inv = self.data.setdefault("inventory", default_inventory())
         inv[key] = int(inv.get(key, 0)) + int(amount)
@@ -349,7 +635,7 @@ class AddonState:
         Returns True on success, False if insufficient balance or invalid key.
         """
 
-        if key not in INVENTORY_KEYS:
+        if key not in _INV_KEYS_SET:
             return False
         inv = self.data.setdefault("inventory", default_inventory())
         current = int(inv.get(key, 0))
@@ -405,21 +691,47 @@ class AddonState:
         """Return the index of the first empty tile, or None if full."""
 
         tiles = self.get_tiles()
-        for idx, tile in enumerate(tiles):
-            if tile is None:
+        heap = self._empty_indices
+        while heap:
+            idx = heap[0]
+            if tiles[idx] is None:
                 return idx
+            # Stale entry: the tile was filled after it was pushed.
+            heapq.heappop(heap)
         return None
 
+    def _clear_tile(self, tiles: List[Optional[Dict[str, Any]]], idx: int) -> None:
+        """Empty the tile at `idx` and record it as free."""
+
+        tiles[idx] = None
+        heapq.heappush(self._empty_indices, idx)
+
+    def _clear_reference_tiles(self, tiles: List[Optional[Dict[str, Any]]], main_id: Any) -> None:
+        """Set the reference tiles of the 2x2 object `main_id` to None."""
+
+        self._id_to_main_idx.pop(main_id, None)
+        for t_idx in self._id_to_ref_indices.pop(main_id, ()):
+            t = tiles[t_idx]
+            if t is not None and t.get("id") == main_id and t.get("is_reference"):
+                self._clear_tile(tiles, t_idx)
+
+    def _main_tile_index(self, idx: int) -> int:
+        """Return the index of the main tile for `idx` (itself unless a reference tile)."""
+
+        tile = self.get_tiles()[idx]
+        if tile is not None and tile.get("is_reference"):
+            return self._id_to_main_idx.get(tile.get("id"), idx)
+        return idx
+
     def _create_tile(self, kind: str, row: int, col: int) -> Dict[str, Any]:
         """Create a new tile dict for the given kind ('plant', 'tree', or 'seed')."""
 
-        now = utc_now()
-        iso_now = to_iso(now)
+        ts_now = to_timestamp(utc_now())
         tile = {
-            "id": str(uuid.uuid4()),
+            "id": _new_uuid(),
             "kind": kind,
-            "planted_at": iso_now,
-            "last_watered_at": iso_now,
+            "planted_at": ts_now,
+            "last_watered_at": ts_now,
             "bloom_until": None,
             "row": int(row),
             "col": int(col),
@@ -448,9 +760,10 @@ class AddonState:
         if kind == "tree":
             if row < 0 or col < 0 or row >= GARDEN_HEIGHT - 1 or col >= GARDEN_WIDTH - 1:
                 return None
+            r2i = self.row_col_to_index
             for dr in range(2):
                 for dc in range(2):
-                    check_idx = self.row_col_to_index(row + dr, col + dc)
+                    check_idx = r2i(row + dr, col + dc)
                     if check_idx is None or tiles[check_idx] is not None:
                         return None
         else:
@@ -517,10 +830,7 @@ class AddonState:
             
             # For cherry blossoms, we need to clear all reference tiles first
             if kind == "cherry_blossom":
-                main_id = tile.get("id")
-                for t_idx, t in enumerate(tiles):
-                    if t is not None and t.get("id") == main_id and t.get("is_reference"):
-                        tiles[t_idx] = None
+                self._clear_reference_tiles(tiles, tile.get("id"))
             
             for dr in range(2):
                 for dc in range(2):
@@ -540,10 +850,12 @@ class AddonState:
                 last_watered_at = tile.get("last_watered_at")
                 bloom_until = tile.get("bloom_until")
                 
+                ref_indices = []
                 for dr in range(2):
                     for dc in range(2):
                         check_idx = self.row_col_to_index(to_row + dr, to_col + dc)
                         if check_idx != to_idx:
+                            ref_indices.append(check_idx)
                             tiles[check_idx] = {
                                 "id": main_id,
                                 "kind": "cherry_blossom",
@@ -556,13 +868,15 @@ class AddonState:
                                 "col": to_col + dc,
                                 "is_reference": True,
                             }
+                self._id_to_ref_indices[main_id] = ref_indices
+                self._id_to_main_idx[main_id] = to_idx
         else:
             # Plant, seed, colorful_plant: check single destination tile
             if tiles[to_idx] is not None:
                 return False
 
         tiles[to_idx] = tile
-        tiles[from_idx] = None
+        self._clear_tile(tiles, from_idx)
 
         if isinstance(tile, dict):
             tile["row"] = int(to_row)
@@ -600,30 +914,26 @@ class AddonState:
         Dead items are skipped and cannot be revived.
         """
 
-        tiles = self.get_tiles()
         now = utc_now()
-        has_living = False
-        for tile in tiles:
-            if tile is not None:
-                status = self.tile_status(tile, now)
-                if not status.is_dead:
-                    has_living = True
-                    break
-        
-        if not has_living:
+        cache: Dict[str, TileStatus] = {}
+        status_of = self._sweep_status
+        living = [
+            tile
+            for tile in self.get_tiles()
+            if tile is not None and not status_of(tile, now, cache).is_dead
+        ]
+        if not living:
             return False
 
-        if not self.spend_token("water", 1):
-            return False
+        with self.batch():
+            if not self.spend_token("water", 1):
+                return False
 
-        iso_now = to_iso(now)
-        for tile in tiles:
-            if tile is not None:
-                status = self.tile_status(tile, now)
-                # Only water living items
-                if not status.is_dead:
-                    tile["last_watered_at"] = iso_now
-        self._save()
+            # Only water living items
+            ts_now = to_timestamp(now)
+            for tile in living:
+                tile["last_watered_at"] = ts_now
+            self._save()
         return True
 
     def apply_sunlight(self) -> bool:
@@ -633,31 +943,26 @@ class AddonState:
         Dead items are skipped and cannot be revived.
         """
 
-        tiles = self.get_tiles()
         now = utc_now()
-        has_living = False
-        for tile in tiles:
-            if tile is not None:
-                status = self.tile_status(tile, now)
-                if not status.is_dead:
-                    has_living = True
-                    break
-        
-        if not has_living:
+        cache: Dict[str, TileStatus] = {}
+        status_of = self._sweep_status
+        living = [
+            tile
+            for tile in self.get_tiles()
+            if tile is not None and not status_of(tile, now, cache).is_dead
+        ]
+        if not living:
             return False
 
-        if not self.spend_token("sunlight", 1):
-            return False
+        with self.batch():
+            if not self.spend_token("sunlight", 1):
+                return False
 
-        until = utc_now() + timedelta(days=1)
-        iso_until = to_iso(until)
-        for tile in tiles:
-            if tile is not None:
-                status = self.tile_status(tile, now)
-                # Only apply sunlight to living items
-                if not status.is_dead:
-                    tile["bloom_until"] = iso_until
-        self._save()
+            # Only apply sunlight to living items
+            ts_until = to_timestamp(now) + SECONDS_PER_DAY
+            for tile in living:
+                tile["bloom_until"] = ts_until
+            self._save()
         return True
 
     def clear_dead(self) -> bool:
@@ -668,20 +973,19 @@ class AddonState:
 
         tiles = self.get_tiles()
         now = utc_now()
+        cache: Dict[str, TileStatus] = {}
+        status_of = self._sweep_status
         changed = False
         for idx, tile in enumerate(tiles):
             if tile is None:
                 continue
-            status = self.tile_status(tile, now)
+            status = status_of(tile, now, cache)
             if status.is_dead:
-                tiles[idx] = None
+                self._clear_tile(tiles, idx)
                 changed = True
                 # Also clear reference tiles for trees/cherry blossoms
                 if tile.get("kind") in ("tree", "cherry_blossom"):
-                    main_id = tile.get("id")
-                    for t_idx, t in enumerate(tiles):
-                        if t is not None and t.get("id") == main_id and t.get("is_reference"):
-                            tiles[t_idx] = None
+                    self._clear_reference_tiles(tiles, tile.get("id"))
         if changed:
             self._save()
         return changed
@@ -696,6 +1000,10 @@ class AddonState:
         """
         return self.data.get("paths", [])
     
+    def has_path(self, row: int, col: int, direction: str) -> bool:
+        """Return True if a path exists on the given edge."""
+        return (row, col, direction) in self._paths_set
+    
     def place_path(self, row: int, col: int, direction: str) -> tuple[bool, str]:
         """Place a path on an edge.
         
@@ -716,19 +1024,19 @@ class AddonState:
             return (False, "Invalid tile position")
         
         # Check if path already exists
-        paths = self.get_paths()
         path_key = (row, col, direction)
-        if path_key in paths:
+        if path_key in self._paths_set:
             return (False, "Path already exists on this edge")
         
-        # Check inventory
-        if not self.spend_token("path", 1):
-            return (False, "No paths in inventory")
-        
-        # Add path
-        paths.append(path_key)
-        self.data["paths"] = paths
-        self._save()
+        with self.batch():
+            # Check inventory
+            if not self.spend_token("path", 1):
+                return (False, "No paths in inventory")
+            
+            # Add path
+            self.data.setdefault("paths", []).append(path_key)
+            self._paths_set.add(path_key)
+            self._save()
         return (True, "Path placed successfully")
     
     def remove_path(self, row: int, col: int, direction: str) -> bool:
@@ -736,14 +1044,14 @@ class AddonState:
         
         Returns True if path was removed, False if it didn't exist.
         """
-        paths = self.get_paths()
         path_key = (row, col, direction)
-        if path_key in paths:
-            paths.remove(path_key)
-            self.data["paths"] = paths
-            # Return path to inventory
-            self.award_token("path", 1)
-            self._save()
+        if path_key in self._paths_set:
+            with self.batch():
+                self._paths_set.discard(path_key)
+                self.get_paths().remove(path_key)
+                # Return path to inventory
+                self.award_token("path", 1)
+                self._save()
             return True
         return False
     
@@ -769,86 +1077,84 @@ class AddonState:
         
         kind = tile.get("kind", "plant")
         
-        # Handle different object types
-        if kind == "plant":
-            tiles[idx] = None
-            self.award_token("plants", 1)
-            self._save()
-            return (True, "Plant removed and returned to inventory")
+        # Award + save happen together; batch so the state is written once.
+        with self.batch():
+            # Handle different object types
+            if kind == "plant":
+                self._clear_tile(tiles, idx)
+                self.award_token("plants", 1)
+                self._save()
+                return (True, "Plant removed and returned to inventory")
         
-        elif kind == "tree":
-            # Remove all 4 tiles of the tree
-            main_id = tile.get("id")
-            tiles[idx] = None
-            # Remove reference tiles
-            for t_idx, t in enumerate(tiles):
-                if t is not None and t.get("id") == main_id and t.get("is_reference"):
-                    tiles[t_idx] = None
-            self.award_token("trees", 1)
-            self._save()
-            return (True, "Tree removed and returned to inventory")
+            elif kind == "tree":
+                # Remove all 4 tiles of the tree
+                self._clear_tile(tiles, idx)
+                # Remove reference tiles
+                self._clear_reference_tiles(tiles, tile.get("id"))
+                self.award_token("trees", 1)
+                self._save()
+                return (True, "Tree removed and returned to inventory")
         
-        elif kind == "seed":
-            tiles[idx] = None
-            self.award_token("seeds", 1)
-            self._save()
-            return (True, "Seed removed and returned to inventory")
+            elif kind == "seed":
+                self._clear_tile(tiles, idx)
+                self.award_token("seeds", 1)
+                self._save()
+                return (True, "Seed removed and returned to inventory")
         
-        elif kind == "colorful_plant":
-            tiles[idx] = None
-            self.award_token("seeds", 1)  # Return as seed
-            self._save()
-            return (True, "Colorful plant removed, seed returned to inventory")
+            elif kind == "colorful_plant":
+                self._clear_tile(tiles, idx)
+                self.award_token("seeds", 1)  # Return as seed
+                self._save()
+                return (True, "Colorful plant removed, seed returned to inventory")
         
-        elif kind == "cherry_blossom":
-            # Remove all 4 tiles of the cherry blossom
-            main_id = tile.get("id")
-            tiles[idx] = None
-            # Remove reference tiles
-            for t_idx, t in enumerate(tiles):
-                if t is not None and t.get("id") == main_id and t.get("is_reference"):
-                    tiles[t_idx] = None
-            self.award_token("seeds", 1)  # Return as seed
-            self._save()
-            return (True, "Cherry blossom removed, seed returned to inventory")
+            elif kind == "cherry_blossom":
+                # Remove all 4 tiles of the cherry blossom
+                self._clear_tile(tiles, idx)
+                # Remove reference tiles
+                self._clear_reference_tiles(tiles, tile.get("id"))
+                self.award_token("seeds", 1)  # Return as seed
+                self._save()
+                return (True, "Cherry blossom removed, seed returned to inventory")
         
-        else:
-            return (False, f"Cannot remove object of type: {kind}")
+            else:
+                return (False, f"Cannot remove object of type: {kind}")
 
     def _find_tree_at_tile(self, row: int, col: int) -> Optional[int]:
         """Find the top-left tile index of a tree or cherry blossom that occupies the given (row, col).
 
         Returns the tile index of the tree's/cherry blossom's top-left tile, or None if not found.
         """
+        if row < 0 or col < 0 or row >= GARDEN_HEIGHT or col >= GARDEN_WIDTH:
+            return None
         tiles = self.get_tiles()
-        # Check if this tile itself is a tree or cherry blossom
-        idx = self.row_col_to_index(row, col)
-        if idx is not None and idx < len(tiles):
-            tile = tiles[idx]
-            if tile is not None and tile.get("kind") in ("tree", "cherry_blossom") and not tile.get("is_reference"):
+        idx = row * GARDEN_WIDTH + col
+        if idx >= len(tiles):
+            return None
+        # Check if this tile itself is a tree or cherry blossom, or a reference to one
+        tile = tiles[idx]
+        if tile is not None and tile.get("kind") in ("tree", "cherry_blossom"):
+            if not tile.get("is_reference"):
                 return idx
+            main_idx = self._id_to_main_idx.get(tile.get("id"))
+            if main_idx is not None:
+                return main_idx
         
         # Check if this tile is part of a tree or cherry blossom (check tiles to the left/above)
-        for dr in range(2):
-            for dc in range(2):
-                check_row = row - dr
-                check_col = col - dc
-                check_idx = self.row_col_to_index(check_row, check_col)
-                if check_idx is not None and check_idx < len(tiles):
-                    tile = tiles[check_idx]
-                    if tile is not None and tile.get("kind") in ("tree", "cherry_blossom") and not tile.get("is_reference"):
-                        # Verify this tree/cherry blossom occupies the target tile
-                        tile_row, tile_col = self.index_to_row_col(check_idx)
-                        if (tile_row <= row < tile_row + 2 and 
-                            tile_col <= col < tile_col + 2):
-                            return check_idx
+        for offset, dr, dc in _BLOCK_NEIGHBORS:
+            if row < dr or col < dc:
+                continue
+            tile = tiles[idx - offset]
+            if tile is not None and tile.get("kind") in ("tree", "cherry_blossom") and not tile.get("is_reference"):
+                return idx - offset
         return None
 
-    def water_tile(self, row: int, col: int) -> tuple[bool, str]:
+    def water_tile(self, row: int, col: int, defer_save: bool = False) -> tuple[bool, str]:
         """Water a specific tile.
 
         For plants, seeds, colorful_plants: costs 1 water.
         For trees, cherry_blossoms: costs 4 water (any of its 4 tiles can be clicked).
+        With `defer_save=True` the change is only marked dirty; call `flush()`
+        or save later.
         Returns (success: bool, message: str).
         """
         idx = self.row_col_to_index(row, col)
@@ -865,13 +1171,8 @@ class AddonState:
         
         # Skip reference tiles, find the main tile
         if tile.get("is_reference"):
-            # Find the main tile by ID
-            main_id = tile.get("id")
-            for t_idx, t in enumerate(tiles):
-                if t is not None and t.get("id") == main_id and not t.get("is_reference"):
-                    tile = t
-                    idx = t_idx
-                    break
+            idx = self._main_tile_index(idx)
+            tile = tiles[idx]
         
         now = utc_now()
         status = self.tile_status(tile, now)
@@ -898,10 +1199,12 @@ class AddonState:
         
         # Spend water and update timestamp
         inv["water"] = current_water - water_cost
-        iso_now = to_iso(now)
-        tile["last_watered_at"] = iso_now
+        tile["last_watered_at"] = to_timestamp(now)
         
-        self._save()
+        if defer_save:
+            self._mark_dirty()
+        else:
+            self._save()
         return (True, f"Watered {kind} (used {water_cost} water).")
 
     def fast_forward_time(self, days: int = 1) -> bool:
@@ -912,38 +1215,21 @@ class AddonState:
         """
 
         tiles = self.get_tiles()
+        if not any(tiles):
+            # Empty garden: nothing to age.
+            return False
         changed = False
-        delta = timedelta(days=days)
+        delta = days * SECONDS_PER_DAY
 
         for tile in tiles:
             if tile is None:
                 continue
 
-            # Make last_watered_at older (subtract days)
-            last_watered_str = tile.get("last_watered_at")
-            if last_watered_str:
-                last_watered = from_iso(last_watered_str)
-                if last_watered:
-                    new_watered = last_watered - delta
-                    tile["last_watered_at"] = to_iso(new_watered)
-                    changed = True
-
-            # Make planted_at older
-            planted_str = tile.get("planted_at")
-            if planted_str:
-                planted = from_iso(planted_str)
-                if planted:
-                    new_planted = planted - delta
-                    tile["planted_at"] = to_iso(new_planted)
-                    changed = True
-
-            # Make bloom_until older (if it exists)
-            bloom_str = tile.get("bloom_until")
-            if bloom_str:
-                bloom_until = from_iso(bloom_str)
-                if bloom_until:
-                    new_bloom = bloom_until - delta
-                    tile["bloom_until"] = to_iso(new_bloom)
+            # Make last_watered_at, planted_at and bloom_until (if set) older
+            for key in ("last_watered_at", "planted_at", "bloom_until"):
+                value = tile.get(key)
+                if value is not None:
+                    tile[key] = value - delta
                     changed = True
 
         if changed:
@@ -953,42 +1239,54 @@ class AddonState:
     # ------------------------------------------------------------------
     # Tile lifecycle logic
     # ------------------------------------------------------------------
-    def _evolve_tile_if_needed(self, tile: Dict[str, Any], idx: int) -> bool:
+    def _evolve_tile_if_needed(
+        self,
+        tile: Dict[str, Any],
+        idx: int,
+        now: Optional[datetime] = None,
+        tiles: Optional[List[Optional[Dict[str, Any]]]] = None,
+        defer_save: bool = False,
+    ) -> bool:
         """Check if a tile should evolve and perform evolution if needed.
-        
+
+        Sweeps over the garden pass their `tiles` list and `defer_save=True`,
+        which only marks the state dirty, then save once at the end.
+
         Returns True if evolution occurred, False otherwise.
         """
-        now = utc_now()
+        ts_now = to_timestamp(now if now is not None else utc_now())
         kind = tile.get("kind")
         evolution_stage = tile.get("evolution_stage", "seed" if kind == "seed" else None)
-        planted_at = from_iso(tile.get("planted_at") or "")
-        last_watered_at = from_iso(tile.get("last_watered_at") or "")
+        planted_at = tile.get("planted_at")
+        last_watered_at = tile.get("last_watered_at")
         
         if planted_at is None or last_watered_at is None:
             return False
         
         # Check if tile is dead - don't evolve dead tiles
-        delta_water = now - last_watered_at
-        if delta_water > timedelta(days=2):
+        if ts_now - last_watered_at > _EVOLVE_DRY_LIMIT:
             return False
         
         # Check time since planted
-        delta_planted = now - planted_at
+        age = ts_now - planted_at
         
         # Seed -> Colorful Plant (1 week)
-        if kind == "seed" and evolution_stage == "seed" and delta_planted >= timedelta(days=7):
+        if kind == "seed" and evolution_stage == "seed" and age >= _EVOLVE_AFTER:
             # Assign random color
             color = random.choice(COLORFUL_PLANT_COLORS)
             tile["kind"] = "colorful_plant"
             tile["evolution_stage"] = "colorful_plant"
             tile["color"] = color
             # Reset planted_at to track colorful plant age
-            tile["planted_at"] = to_iso(now)
-            self._save()
+            tile["planted_at"] = ts_now
+            if defer_save:
+                self._mark_dirty()
+            else:
+                self._save()
             return True
         
         # Colorful Plant -> Cherry Blossom (1 week)
-        if kind == "colorful_plant" and evolution_stage == "colorful_plant" and delta_planted >= timedelta(days=7):
+        if kind == "colorful_plant" and evolution_stage == "colorful_plant" and age >= _EVOLVE_AFTER:
             color = tile.get("color")
             if color is None:
                 return False
@@ -998,110 +1296,157 @@ class AddonState:
             if row < 0 or col < 0 or row >= GARDEN_HEIGHT - 1 or col >= GARDEN_WIDTH - 1:
                 return False
             
-            tiles = self.get_tiles()
+            if tiles is None:
+                tiles = self.get_tiles()
             # Check all 4 tiles are available (current tile + 3 neighbors)
-            occupied = []
-            for dr in range(2):
-                for dc in range(2):
-                    check_idx = self.row_col_to_index(row + dr, col + dc)
-                    if check_idx is None:
-                        return False
-                    if check_idx != idx and tiles[check_idx] is not None:
-                        occupied.append(check_idx)
-            
-            if occupied:
-                return False
+            for offset, _, _ in _BLOCK_NEIGHBORS:
+                if tiles[idx + offset] is not None:
+                    return False
             
             # Transform to cherry blossom (2x2)
             tile["kind"] = "cherry_blossom"
             tile["evolution_stage"] = "cherry_blossom"
             # Keep the color
             # Reset planted_at to track cherry blossom age
-            tile["planted_at"] = to_iso(now)
+            tile["planted_at"] = ts_now
             
             # Mark all 4 tiles as part of the cherry blossom
-            for dr in range(2):
-                for dc in range(2):
-                    check_idx = self.row_col_to_index(row + dr, col + dc)
-                    if check_idx != idx:
-                        # Create a reference tile pointing to the main tile
-                        tiles[check_idx] = {
-                            "id": tile["id"],  # Same ID
-                            "kind": "cherry_blossom",
-                            "evolution_stage": "cherry_blossom",
-                            "color": color,
-                            "planted_at": tile["planted_at"],
-                            "last_watered_at": tile["last_watered_at"],
-                            "bloom_until": tile.get("bloom_until"),
-                            "row": row + dr,
-                            "col": col + dc,
-                            "is_reference": True,  # Mark as reference tile
-                        }
+            ref_indices = []
+            for offset, dr, dc in _BLOCK_NEIGHBORS:
+                ref_idx = idx + offset
+                ref_indices.append(ref_idx)
+                # Create a reference tile pointing to the main tile
+                tiles[ref_idx] = {
+                    "id": tile["id"],  # Same ID
+                    "kind": "cherry_blossom",
+                    "evolution_stage": "cherry_blossom",
+                    "color": color,
+                    "planted_at": tile["planted_at"],
+                    "last_watered_at": tile["last_watered_at"],
+                    "bloom_until": tile.get("bloom_until"),
+                    "row": row + dr,
+                    "col": col + dc,
+                    "is_reference": True,  # Mark as reference tile
+                }
+            self._id_to_ref_indices[tile["id"]] = ref_indices
+            self._id_to_main_idx[tile["id"]] = idx
             
-            self._save()
+            if defer_save:
+                self._mark_dirty()
+            else:
+                self._save()
             return True
         
         return False
+
+    def evolve_and_status_all(self) -> List[TileStatus]:
+        """Evolve every eligible tile and compute the status of each tile.
+
+        Reads the clock once and walks the garden once. The returned list is
+        index-aligned with `get_tiles()`.
+        """
+
+        now = utc_now()
+        tiles = self.get_tiles()
+        cache: Dict[str, TileStatus] = {}
+        evolve = self._evolve_tile_if_needed
+        status_of = self._sweep_status
+        statuses: List[TileStatus] = []
+        append = statuses.append
+        changed = False
+        for idx, tile in enumerate(tiles):
+            if tile is None:
+                append(_EMPTY_STATUS)
+                continue
+            # Reference tiles (rest of a 2x2 object) evolve with their main
+            # tile. A cherry blossom only claims empty tiles below and to the
+            # right of its main tile, so they are reached after it evolves and
+            # pick up its cached status.
+            if not tile.get("is_reference") and evolve(tile, idx, now, tiles, defer_save=True):
+                changed = True
+            append(status_of(tile, now, cache))
+        if changed:
+            self._save()
+        return statuses
+
+    def evolve_all(self) -> bool:
+        """Evolve every eligible tile, saving once at the end.
+
+        Returns True if any tile evolved.
+        """
+
+        now = utc_now()
+        tiles = self.get_tiles()
+        evolve = self._evolve_tile_if_needed
+        changed = False
+        for idx, tile in enumerate(tiles):
+            if tile is None or tile.get("is_reference"):
+                continue
+            if evolve(tile, idx, now, tiles, defer_save=True):
+                changed = True
+        if changed:
+            self._save()
+        return changed
     
+    def _sweep_status(
+        self, tile: Dict[str, Any], now: datetime, cache: Dict[str, TileStatus]
+    ) -> TileStatus:
+        """`tile_status` memoized by tile id for a single sweep over the garden.
+
+        Reference tiles share the id of their 2x2 object, so they take the
+        status of the main tile, which comes first in row-major order.
+        """
+
+        tid = tile.get("id")
+        if tid is None:
+            return self.tile_status(tile, now)
+        status = cache.get(tid)
+        if status is None:
+            status = cache[tid] = self.tile_status(tile, now)
+        return status
+
     def tile_status(
         self, tile: Optional[Dict[str, Any]], now: Optional[datetime] = None
     ) -> TileStatus:
-        """Compute lifecycle status flags for a tile."""
+        """Compute lifecycle status flags for a tile.
+
+        Empty tiles all share `_EMPTY_STATUS`; callers must not mutate it.
+        """
 
-        status = TileStatus()
         if tile is None:
-            return status
+            return _EMPTY_STATUS
 
+        status = TileStatus()
         status.is_empty = False
-        if now is None:
-            now = utc_now()
+        ts_now = to_timestamp(now if now is not None else utc_now())
 
         # Bloom status
-        bloom_until = from_iso(tile.get("bloom_until") or "")
-        if bloom_until and bloom_until > now:
+        bloom_until = tile.get("bloom_until")
+        if bloom_until is not None and bloom_until > ts_now:
             status.is_blooming = True
 
         # Watering / death
-        last_watered = from_iso(tile.get("last_watered_at") or "")
+        last_watered = tile.get("last_watered_at")
         if last_watered is None:
             # No watering info: treat as dead for safety.
             status.is_dead = True
             return status
 
-        delta = now - last_watered
-        kind = tile.get("kind")
+        thresholds = _WILT_TABLE.get(tile.get("kind"))
+        if thresholds is None:
+            return status
+        dead_after, heavy_wilt_from, wilt_from, wilt_level = thresholds
 
-        # Dead / wilt thresholds
-        if kind == "plant":
-            # Plants:
-            # - 0–1 days: healthy
-            # - 1–2 days: wilt level 1 (current wilt colour)
-            # - 2–3 days: wilt level 2 (darker, more brown)
-            # - >3 days: dead
-            if delta > timedelta(days=3):
-                status.is_dead = True
-            elif delta >= timedelta(days=2):
-                status.is_wilted = True
-                status.wilt_level = 2
-            elif delta >= timedelta(days=1):
-                status.is_wilted = True
-                status.wilt_level = 1
-        elif kind == "tree":
-            # Trees: keep existing thresholds
-            if delta > timedelta(days=2):
-                status.is_dead = True
-            elif delta >= timedelta(days=1):
-                status.is_wilted = True
-        elif kind in ("seed", "colorful_plant", "cherry_blossom"):
-            # Seeds, colorful plants, and cherry blossoms:
-            # - 0–1 days: healthy
-            # - 1–2 days: wilted
-            # - >2 days: dead
-            if delta > timedelta(days=2):
-                status.is_dead = True
-            elif delta >= timedelta(days=1):
-                status.is_wilted = True
-                status.wilt_level = 1
+        # Days since last watered
+        delta = (ts_now - last_watered) / SECONDS_PER_DAY
+        if delta > dead_after:
+            status.is_dead = True
+        elif heavy_wilt_from is not None and delta >= heavy_wilt_from:
+            status.is_wilted = True
+            status.wilt_level = 2
+        elif delta >= wilt_from:
+            status.is_wilted = True
+            status.wilt_level = wilt_level
 
         return status
 
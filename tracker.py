@@ -6,14 +6,22 @@ streak thresholds. Keeps a per-session streak counter only.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Set
+from dataclasses import dataclass
+from typing import Dict, List
 
 from aqt import mw
 from aqt.utils import tooltip
 
 from .state import AddonState
 
+# (streak, inventory key, tooltip label) for each one-off streak reward.
+_STREAK_REWARDS = (
+    (15, "water", "Water"),
+    (30, "plants", "Plant"),
+    (50, "trees", "Tree"),
+)
+_STREAK_THRESHOLD_SET = frozenset(threshold for threshold, _, _ in _STREAK_REWARDS)
+
 
 @dataclass
 class StreakTracker:
@@ -21,15 +29,15 @@ class StreakTracker:
 
     state: AddonState
     current_streak: int = 0
-    # Track which multiples have been awarded in this streak run to avoid duplicates.
-    # Key: (threshold, multiple), e.g., (5, 1) means we awarded at streak 5.
-    awarded_multiples: Set[tuple[int, int]] = field(default_factory=set)
+    # Track which rewards have been given in this streak run to avoid duplicates.
+    # Bit i is set once _STREAK_REWARDS[i] has been awarded.
+    awarded_mask: int = 0
 
     def reset(self) -> None:
-        """Reset streak and per-run awarded multiples."""
+        """Reset streak and per-run awarded rewards."""
 
         self.current_streak = 0
-        self.awarded_multiples.clear()
+        self.awarded_mask = 0
 
     def handle_answer(self, ease: int) -> None:
         """Handle a reviewer answer.
@@ -48,7 +56,8 @@ class StreakTracker:
 
         # Correct answer.
         self.current_streak += 1
-        self._maybe_award_for_streak()
+        if self.current_streak in _STREAK_THRESHOLD_SET:
+            self._maybe_award_for_streak()
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -65,42 +74,13 @@ class StreakTracker:
         streak = self.current_streak
         awards: List[str] = []
 
-        # Track what we're awarding at this exact streak to avoid duplicates
-        award_water = False
-        award_plant = False
-        award_tree = False
-
-        # 15 correct: water
-        if streak == 15:
-            key = (15, 1)
-            if key not in self.awarded_multiples:
-                self.awarded_multiples.add(key)
-                award_water = True
-
-        # 30 correct: plant
-        if streak == 30:
-            key = (30, 1)
-            if key not in self.awarded_multiples:
-                self.awarded_multiples.add(key)
-                award_plant = True
-
-        # 50 correct: tree
-        if streak == 50:
-            key = (50, 1)
-            if key not in self.awarded_multiples:
-                self.awarded_multiples.add(key)
-                award_tree = True
-
-        # Apply awards
-        if award_water:
-            self.state.award_token("water", 1)
-            awards.append("Water")
-        if award_plant:
-            self.state.award_token("plants", 1)
-            awards.append("Plant")
-        if award_tree:
-            self.state.award_token("trees", 1)
-            awards.append("Tree")
+        for i, (threshold, inv_key, label) in enumerate(_STREAK_REWARDS):
+            bit = 1 << i
+            if streak != threshold or self.awarded_mask & bit:
+                continue
+            self.awarded_mask |= bit
+            self.state.award_token(inv_key, 1)
+            awards.append(label)
 
         # Show tooltip if we awarded anything
         if awards:
@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
+from typing import Dict, List, Optional, Tuple
+
 from aqt import mw
 from aqt.qt import (
     QComboBox,
     QDialog,
     QDialogButtonBox,
+    QFrame,
     QGroupBox,
     QHBoxLayout,
     QLabel,
     QPushButton,
     Qt,
+    QTextDocument,
     QTextEdit,
+    QTimer,
     QVBoxLayout,
     QWidget,
+    pyqtSlot,
 )
 from aqt.utils import tooltip
 
@@ -22,6 +28,146 @@ from .constants import AESTHETIC_MODES, SHOP_PRICES, THEME_UNLOCK_PRICE
 from .garden_scene import GardenView
 from .state import AddonState
 
+# Shop inventory keys with their button names, in display order.
+_SHOP_ITEMS = (
+    ("water", "Water"),
+    ("plants", "Plant"),
+    ("trees", "Tree"),
+    ("sunlight", "Sunlight"),
+    ("seeds", "Seed"),
+    ("path", "Path"),
+)
+# Theme selector entries, in combo box order.
+_MODE_BY_INDEX = tuple(AESTHETIC_MODES)
+_INDEX_BY_MODE = {mode: index for index, mode in enumerate(_MODE_BY_INDEX)}
+_THEME_DISPLAY_NAMES = (
+    "Default",
+    "Night Garden",
+    "Summer Garden",
+    "Winter Garden",
+    "Spring Garden",
+    "Autumn Garden",
+)
+# Themes sold in the shop ("default" is always unlocked).
+_UNLOCKABLE_THEMES = tuple(mode for mode in AESTHETIC_MODES if mode != "default")
+
+# Body of the "Read Instructions" dialog.
+_INSTRUCTIONS_HTML = """
+<h1>AnkiGarden - User Guide</h1>
+
+<h2>Getting Started</h2>
+<p>Welcome to AnkiGarden! This add-on lets you create and maintain a beautiful garden while you study with Anki. Your garden grows as you review cards correctly.</p>
+
+<p><b>Starting Inventory:</b> You begin with 1 plant and 3 waters. Use these wisely to start your garden!</p>
+
+<h2>How to Earn Rewards</h2>
+<p>As you review cards in Anki, you'll earn rewards based on your streak of correct answers:</p>
+<ul>
+<li><b>15 cards correct in a row:</b> +1 Water</li>
+<li><b>30 cards correct in a row:</b> +1 Plant</li>
+<li><b>50 cards correct in a row:</b> +1 Tree</li>
+</ul>
+<p>You also earn 1 coin for every correct answer. Wrong answers reset your streak, so stay focused!</p>
+
+<h2>Actions Section</h2>
+
+<h3>🌱 Place Plant</h3>
+<p>Click this button, then click on an empty tile in your garden to place a plant. Plants need to be watered regularly to stay healthy.</p>
+
+<h3>🌳 Place Tree</h3>
+<p>Trees are larger than plants and take up 2x2 tiles. Click this button, then click on an empty tile to place a tree. Trees require 4 water to water them.</p>
+
+<h3>🌰 Place Seed</h3>
+<p>Seeds are special! When you place a seed, it will evolve into a colorful plant after 1 week (if kept watered), and then into a cherry blossom tree after another week. Seeds are rare and valuable.</p>
+
+<h3>🪨 Place Path</h3>
+<p>Click this button to enter path placement mode. In this mode, click near the edges between tiles to place decorative paths. The button will change to "Exit Path Placing" while in this mode. Click it again to exit.</p>
+
+<h3>💧 Water Garden</h3>
+<p>Click this button to enter watering mode. In this mode, click on individual tiles to water them. Plants and seeds cost 1 water each, while trees cost 4 water. The button will change to "Exit Watering" while in this mode.</p>
+
+<h3>☀️ Apply Sunlight</h3>
+<p>This powerful action makes everything in your garden bloom for 1 day! It costs 1 sunlight token. Use it to make your garden beautiful and vibrant.</p>
+
+<h3>🗑️ Remove Object</h3>
+<p>Click this button to enter remove mode. In this mode, click on any object (plant, tree, seed, or path) to remove it and return it to your inventory. The button will change to "Exit Removing" while in this mode.</p>
+
+<h3>Clear Dead</h3>
+<p>Removes all dead items from your garden. Dead items cannot be revived, so make sure to water your plants regularly!</p>
+
+<h2>Inventory Section</h2>
+<p>The inventory shows all your current resources:</p>
+<ul>
+<li><b>💧 Water:</b> Used to water plants, trees, and seeds</li>
+<li><b>🌱 Plants:</b> Can be placed in your garden</li>
+<li><b>🌳 Trees:</b> Large 2x2 objects for your garden</li>
+<li><b>☀️ Sunlight:</b> Makes everything bloom</li>
+<li><b>🪙 Coins:</b> Used to purchase items in the shop</li>
+<li><b>🌰 Seeds:</b> Evolve into colorful plants and cherry blossoms</li>
+<li><b>🪨 Paths:</b> Decorative paths for your garden</li>
+</ul>
+
+<p>You can also change the theme of your garden using the theme selector. Some themes need to be unlocked first in the shop.</p>
+
+<h2>Shop Section</h2>
+<p>Use your coins to purchase items:</p>
+<ul>
+<li><b>Water:</b> 20 coins</li>
+<li><b>Plant:</b> 50 coins</li>
+<li><b>Tree:</b> 100 coins</li>
+<li><b>Sunlight:</b> 200 coins</li>
+<li><b>Seed:</b> 1000 coins</li>
+<li><b>Path:</b> 20 coins</li>
+</ul>
+
+<p>You can also unlock new themes for 2000 coins each. Unlocked themes include Night Garden, Summer Garden, Winter Garden, Spring Garden, and Autumn Garden.</p>
+
+<h2>Plant Lifecycle</h2>
+<p>All plants, trees, and seeds need regular watering to stay healthy:</p>
+<ul>
+<li><b>Plants:</b> Need water every 1-2 days. After 3 days without water, they die.</li>
+<li><b>Trees:</b> Need water every 1-2 days. After 2 days without water, they die.</li>
+<li><b>Seeds:</b> Need water every 1-2 days. After 2 days without water, they die.</li>
+</ul>
+
+<p><b>Seed Evolution:</b> Seeds are special! If you keep a seed watered for 1 week, it will evolve into a colorful plant with vibrant flowers. If you keep that colorful plant watered for another week, it will evolve into a beautiful cherry blossom tree (2x2).</p>
+
+<h2>Tips for Success</h2>
+<ul>
+<li>Water your plants regularly to keep them healthy</li>
+<li>Use sunlight to make your garden bloom beautifully</li>
+<li>Save up coins to purchase seeds - they're worth the investment!</li>
+<li>Plan your garden layout before placing items</li>
+<li>Use paths to create beautiful walkways through your garden</li>
+<li>Try different themes to find your favorite aesthetic</li>
+</ul>
+
+<p><b>Happy Gardening!</b> 🌱🌳🌸</p>
+"""
+
+# _INSTRUCTIONS_HTML parsed once, shared by every instructions dialog.
+_instructions_doc: Optional[QTextDocument] = None
+
+
+def _instructions_document() -> QTextDocument:
+    """Return the parsed instructions, building them on first use."""
+
+    global _instructions_doc
+    if _instructions_doc is None:
+        # Owned by the main window so it outlives any one garden dialog.
+        _instructions_doc = QTextDocument(mw)
+        _instructions_doc.setHtml(_INSTRUCTIONS_HTML)
+    return _instructions_doc
+
+
+def _vertical_separator() -> QFrame:
+    """Thin vertical rule for separating groups in a horizontal layout."""
+
+    sep = QFrame()
+    sep.setFrameShape(QFrame.Shape.VLine)
+    sep.setFrameShadow(QFrame.Shadow.Sunken)
+    return sep
+
 
 class GardenDialog(QDialog):
     """Main dialog showing the AnkiGarden garden and inventory."""
@@ -29,6 +175,23 @@ class GardenDialog(QDialog):
     def __init__(self, state: AddonState, parent=None) -> None:
         super().__init__(parent or mw)
         self.state = state
+        # Built on first use by on_read_instructions, then reused.
+        self._instructions_dialog: Optional[QDialog] = None
+        # Inventory counts currently shown, so unchanged labels are not re-set.
+        self._last_inv: Dict[str, int] = {}
+        # Interaction modes toggled by the action buttons.
+        self._watering_mode_active = False
+        self._path_placement_mode_active = False
+        self._remove_mode_active = False
+        self._fast_forward_enabled = False
+        # Set when refresh() was skipped because the dialog was hidden.
+        self._needs_refresh = False
+        # refresh() only (re)starts this timer, so several requests made in
+        # one event-loop pass collapse into a single _do_refresh().
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
 
         self.setWindowTitle("AnkiGarden")
         self._build_ui()
@@ -53,15 +216,18 @@ class GardenDialog(QDialog):
         self.seeds_label = QLabel()
         self.path_label = QLabel()
 
-        # Make inventory visually richer (emojis + spacing)
-        # Styling will be set in _refresh_inventory to include spacing
+        # Make inventory visually richer (emojis + spacing); the text is set
+        # in _refresh_inventory, the style only once here.
+        for label in (self.water_label, self.plants_label, self.trees_label,
+                      self.sunlight_label, self.coins_label, self.seeds_label, self.path_label):
+            label.setStyleSheet("font-size: 12pt; margin-right: 15px;")
 
         # Add Read Instructions button on the left side
         self.read_instructions_btn = QPushButton("Read Instructions")
         self.read_instructions_btn.clicked.connect(self.on_read_instructions)
         self.read_instructions_btn.setStyleSheet("QPushButton { background-color: #4A90E2; color: white; font-weight: bold; }")
         inv_layout.addWidget(self.read_instructions_btn)
-        inv_layout.addWidget(QLabel(" | "))  # Separator
+        inv_layout.addWidget(_vertical_separator())
         
         inv_layout.addStretch(1)
         inv_layout.addWidget(self.water_label)
@@ -73,38 +239,18 @@ class GardenDialog(QDialog):
         inv_layout.addWidget(self.path_label)
         
         # Add theme selector to inventory section
-        inv_layout.addWidget(QLabel(" | "))  # Separator
+        inv_layout.addWidget(_vertical_separator())
         theme_label = QLabel("Theme:")
         self.mode_combo = QComboBox()
-        self.mode_combo.addItems([
-            "Default",
-            "Night Garden",
-            "Summer Garden",
-            "Winter Garden",
-            "Spring Garden",
-            "Autumn Garden",
-        ])
+        self.mode_combo.addItems(list(_THEME_DISPLAY_NAMES))
+        # Item texts as last set, so _refresh_mode_selector only touches changes.
+        self._combo_texts = [self.mode_combo.itemText(i) for i in range(self.mode_combo.count())]
         self.mode_combo.currentIndexChanged.connect(self.on_mode_changed)
         inv_layout.addWidget(theme_label)
         inv_layout.addWidget(self.mode_combo)
         inv_layout.addStretch(1)
         main_layout.addWidget(inv_group)
 
-        # Shop group (with theme unlocks) - create buttons first
-        self.buy_water_btn = QPushButton(f"Buy Water ({SHOP_PRICES['water']} coins)")
-        self.buy_plant_btn = QPushButton(f"Buy Plant ({SHOP_PRICES['plants']} coins)")
-        self.buy_tree_btn = QPushButton(f"Buy Tree ({SHOP_PRICES['trees']} coins)")
-        self.buy_sunlight_btn = QPushButton(f"Buy Sunlight ({SHOP_PRICES['sunlight']} coins)")
-        self.buy_seed_btn = QPushButton(f"Buy Seed ({SHOP_PRICES['seeds']} coins)")
-        
-        self.buy_water_btn.clicked.connect(lambda: self.on_purchase("water"))
-        self.buy_plant_btn.clicked.connect(lambda: self.on_purchase("plants"))
-        self.buy_tree_btn.clicked.connect(lambda: self.on_purchase("trees"))
-        self.buy_sunlight_btn.clicked.connect(lambda: self.on_purchase("sunlight"))
-        self.buy_seed_btn.clicked.connect(lambda: self.on_purchase("seeds"))
-        self.buy_path_btn = QPushButton(f"Buy Path ({SHOP_PRICES['path']} coins)")
-        self.buy_path_btn.clicked.connect(lambda: self.on_purchase("path"))
-        
         # Shop group (with theme unlocks)
         shop_group = QGroupBox("Shop")
         shop_layout = QVBoxLayout(shop_group)
@@ -112,12 +258,16 @@ class GardenDialog(QDialog):
         # Items shop
         items_shop_layout = QHBoxLayout()
         items_shop_layout.addStretch(1)
-        items_shop_layout.addWidget(self.buy_water_btn)
-        items_shop_layout.addWidget(self.buy_plant_btn)
-        items_shop_layout.addWidget(self.buy_tree_btn)
-        items_shop_layout.addWidget(self.buy_sunlight_btn)
-        items_shop_layout.addWidget(self.buy_seed_btn)
-        items_shop_layout.addWidget(self.buy_path_btn)
+        # Shop buttons share one slot, which reads the item key off the sender;
+        # (button, price) pairs are snapshotted for _refresh_buttons.
+        self._buy_btn_prices: List[Tuple[QPushButton, int]] = []
+        for key, name in _SHOP_ITEMS:
+            price = SHOP_PRICES[key]
+            btn = QPushButton(f"Buy {name} ({price} coins)")
+            btn.setProperty("item", key)
+            btn.clicked.connect(self._on_buy_clicked)
+            self._buy_btn_prices.append((btn, price))
+            items_shop_layout.addWidget(btn)
         items_shop_layout.addStretch(1)
         shop_layout.addLayout(items_shop_layout)
         
@@ -125,23 +275,14 @@ class GardenDialog(QDialog):
         themes_shop_layout = QHBoxLayout()
         themes_shop_layout.addStretch(1)
         themes_shop_layout.addWidget(QLabel("Unlock Themes:"))
-        self.unlock_night_btn = QPushButton(f"Unlock Night ({THEME_UNLOCK_PRICE} coins)")
-        self.unlock_summer_btn = QPushButton(f"Unlock Summer ({THEME_UNLOCK_PRICE} coins)")
-        self.unlock_winter_btn = QPushButton(f"Unlock Winter ({THEME_UNLOCK_PRICE} coins)")
-        self.unlock_spring_btn = QPushButton(f"Unlock Spring ({THEME_UNLOCK_PRICE} coins)")
-        self.unlock_autumn_btn = QPushButton(f"Unlock Autumn ({THEME_UNLOCK_PRICE} coins)")
-        
-        self.unlock_night_btn.clicked.connect(lambda: self.on_unlock_theme("night"))
-        self.unlock_summer_btn.clicked.connect(lambda: self.on_unlock_theme("summer"))
-        self.unlock_winter_btn.clicked.connect(lambda: self.on_unlock_theme("winter"))
-        self.unlock_spring_btn.clicked.connect(lambda: self.on_unlock_theme("spring"))
-        self.unlock_autumn_btn.clicked.connect(lambda: self.on_unlock_theme("autumn"))
-        
-        themes_shop_layout.addWidget(self.unlock_night_btn)
-        themes_shop_layout.addWidget(self.unlock_summer_btn)
-        themes_shop_layout.addWidget(self.unlock_winter_btn)
-        themes_shop_layout.addWidget(self.unlock_spring_btn)
-        themes_shop_layout.addWidget(self.unlock_autumn_btn)
+        # All unlock buttons share one slot, which reads the theme off the sender.
+        self.unlock_btns: Dict[str, QPushButton] = {}
+        for theme in _UNLOCKABLE_THEMES:
+            btn = QPushButton(f"Unlock {theme.title()} ({THEME_UNLOCK_PRICE} coins)")
+            btn.setProperty("theme", theme)
+            btn.clicked.connect(self._on_unlock_clicked)
+            self.unlock_btns[theme] = btn
+            themes_shop_layout.addWidget(btn)
         themes_shop_layout.addStretch(1)
         shop_layout.addLayout(themes_shop_layout)
         
@@ -197,7 +338,6 @@ class GardenDialog(QDialog):
         
         # Hide fast forward button initially
         self.fast_forward_btn.hide()
-        self._fast_forward_enabled = False
         
         # Add emoji indicator for active modes
         self.mode_indicator_label = QLabel()
@@ -205,17 +345,17 @@ class GardenDialog(QDialog):
         self.mode_indicator_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         btn_layout.addWidget(self.mode_indicator_label)
         btn_layout.addStretch(1)
-        
-        self._watering_mode_active = False
-        self._path_placement_mode_active = False
-        self._remove_mode_active = False
         content_layout.addWidget(btn_group)
 
         # Garden (graphics view) - on the right
         grid_group = QGroupBox("Garden")
         grid_layout = QVBoxLayout(grid_group)
         self.garden_view = GardenView(self.state, grid_group)
-        self.garden_view.stateChanged.connect(self.refresh)
+        # Queued: the scene emits from inside its own mouse handlers and
+        # animations, so never refresh (and rebuild its items) re-entrantly.
+        self.garden_view.stateChanged.connect(
+            self.refresh, type=Qt.ConnectionType.QueuedConnection
+        )
         # Pass dialog reference to garden view for special tile click handling
         self.garden_view.set_dialog_reference(self)
         grid_layout.addWidget(self.garden_view)
@@ -257,7 +397,11 @@ class GardenDialog(QDialog):
         self.refresh()
 
     def on_place_path(self) -> None:
-        """Toggle path placement mode."""
+        """Toggle path placement mode.
+
+        Mode toggles change no state, so they only update their button text and
+        the mode indicator instead of running a full refresh().
+        """
         # Check if we have paths before toggling
         inv = self.state.get_inventory()
         if inv.get("path", 0) <= 0 and not self._path_placement_mode_active:
@@ -276,7 +420,7 @@ class GardenDialog(QDialog):
         else:
             self.place_path_btn.setText("Place Path")
             tooltip("Path placement mode cancelled.", parent=self)
-        self.refresh()
+        self._update_mode_indicator()
 
     def on_remove_object(self) -> None:
         """Toggle remove object mode."""
@@ -289,7 +433,7 @@ class GardenDialog(QDialog):
         else:
             self.remove_object_btn.setText("Remove Object")
             tooltip("Remove mode cancelled.", parent=self)
-        self.refresh()
+        self._update_mode_indicator()
 
     def on_water_garden(self) -> None:
         """Toggle watering mode - click tiles to water them individually."""
@@ -302,7 +446,7 @@ class GardenDialog(QDialog):
         else:
             self.water_garden_btn.setText("Water Garden")
             tooltip("Watering mode cancelled.", parent=self)
-        self.refresh()
+        self._update_mode_indicator()
 
     def on_apply_sunlight(self) -> None:
         did = self.state.apply_sunlight()
@@ -313,7 +457,10 @@ class GardenDialog(QDialog):
             )
         else:
             tooltip("Sunlight applied: everything is blooming!", parent=self)
-        self.refresh()
+        # Rebuild the scene now so the glow animates the new items, and drop
+        # any queued refresh that would rebuild them again right after.
+        self._refresh_timer.stop()
+        self._do_refresh()
         if did:
             self.garden_view.glow()
 
@@ -342,6 +489,12 @@ class GardenDialog(QDialog):
 
     def on_read_instructions(self) -> None:
         """Open a dialog with instructions on how to use AnkiGarden."""
+        if self._instructions_dialog is None:
+            self._instructions_dialog = self._build_instructions_dialog()
+        self._instructions_dialog.exec()
+
+    def _build_instructions_dialog(self) -> QDialog:
+        """Create the instructions dialog (done once per garden dialog)."""
         instructions_dialog = QDialog(self)
         instructions_dialog.setWindowTitle("AnkiGarden Instructions")
         instructions_dialog.setMinimumSize(600, 700)
@@ -353,100 +506,7 @@ class GardenDialog(QDialog):
         text_edit.setReadOnly(True)
         text_edit.setStyleSheet("font-size: 11pt; padding: 10px;")
         
-        instructions = """
-<h1>AnkiGarden - User Guide</h1>
-
-<h2>Getting Started</h2>
-<p>Welcome to AnkiGarden! This add-on lets you create and maintain a beautiful garden while you study with Anki. Your garden grows as you review cards correctly.</p>
-
-<p><b>Starting Inventory:</b> You begin with 1 plant and 3 waters. Use these wisely to start your garden!</p>
-
-<h2>How to Earn Rewards</h2>
-<p>As you review cards in Anki, you'll earn rewards based on your streak of correct answers:</p>
-<ul>
-<li><b>15 cards correct in a row:</b> +1 Water</li>
-<li><b>30 cards correct in a row:</b> +1 Plant</li>
-<li><b>50 cards correct in a row:</b> +1 Tree</li>
-</ul>
-<p>You also earn 1 coin for every correct answer. Wrong answers reset your streak, so stay focused!</p>
-
-<h2>Actions Section</h2>
-
-<h3>🌱 Place Plant</h3>
-<p>Click this button, then click on an empty tile in your garden to place a plant. Plants need to be watered regularly to stay healthy.</p>
-
-<h3>🌳 Place Tree</h3>
-<p>Trees are larger than plants and take up 2x2 tiles. Click this button, then click on an empty tile to place a tree. Trees require 4 water to water them.</p>
-
-<h3>🌰 Place Seed</h3>
-<p>Seeds are special! When you place a seed, it will evolve into a colorful plant after 1 week (if kept watered), and then into a cherry blossom tree after another week. Seeds are rare and valuable.</p>
-
-<h3>🪨 Place Path</h3>
-<p>Click this button to enter path placement mode. In this mode, click near the edges between tiles to place decorative paths. The button will change to "Exit Path Placing" while in this mode. Click it again to exit.</p>
-
-<h3>💧 Water Garden</h3>
-<p>Click this button to enter watering mode. In this mode, click on individual tiles to water them. Plants and seeds cost 1 water each, while trees cost 4 water. The button will change to "Exit Watering" while in this mode.</p>
-
-<h3>☀️ Apply Sunlight</h3>
-<p>This powerful action makes everything in your garden bloom for 1 day! It costs 1 sunlight token. Use it to make your garden beautiful and vibrant.</p>
-
-<h3>🗑️ Remove Object</h3>
-<p>Click this button to enter remove mode. In this mode, click on any object (plant, tree, seed, or path) to remove it and return it to your inventory. The button will change to "Exit Removing" while in this mode.</p>
-
-<h3>Clear Dead</h3>
-<p>Removes all dead items from your garden. Dead items cannot be revived, so make sure to water your plants regularly!</p>
-
-<h2>Inventory Section</h2>
-<p>The inventory shows all your current resources:</p>
-<ul>
-<li><b>💧 Water:</b> Used to water plants, trees, and seeds</li>
-<li><b>🌱 Plants:</b> Can be placed in your garden</li>
-<li><b>🌳 Trees:</b> Large 2x2 objects for your garden</li>
-<li><b>☀️ Sunlight:</b> Makes everything bloom</li>
-<li><b>🪙 Coins:</b> Used to purchase items in the shop</li>
-<li><b>🌰 Seeds:</b> Evolve into colorful plants and cherry blossoms</li>
-<li><b>🪨 Paths:</b> Decorative paths for your garden</li>
-</ul>
-
-<p>You can also change the theme of your garden using the theme selector. Some themes need to be unlocked first in the shop.</p>
-
-<h2>Shop Section</h2>
-<p>Use your coins to purchase items:</p>
-<ul>
-<li><b>Water:</b> 20 coins</li>
-<li><b>Plant:</b> 50 coins</li>
-<li><b>Tree:</b> 100 coins</li>
-<li><b>Sunlight:</b> 200 coins</li>
-<li><b>Seed:</b> 1000 coins</li>
-<li><b>Path:</b> 20 coins</li>
-</ul>
-
-<p>You can also unlock new themes for 2000 coins each. Unlocked themes include Night Garden, Summer Garden, Winter Garden, Spring Garden, and Autumn Garden.</p>
-
-<h2>Plant Lifecycle</h2>
-<p>All plants, trees, and seeds need regular watering to stay healthy:</p>
-<ul>
-<li><b>Plants:</b> Need water every 1-2 days. After 3 days without water, they die.</li>
-<li><b>Trees:</b> Need water every 1-2 days. After 2 days without water, they die.</li>
-<li><b>Seeds:</b> Need water every 1-2 days. After 2 days without water, they die.</li>
-</ul>
-
-<p><b>Seed Evolution:</b> Seeds are special! If you keep a seed watered for 1 week, it will evolve into a colorful plant with vibrant flowers. If you keep that colorful plant watered for another week, it will evolve into a beautiful cherry blossom tree (2x2).</p>
-
-<h2>Tips for Success</h2>
-<ul>
-<li>Water your plants regularly to keep them healthy</li>
-<li>Use sunlight to make your garden bloom beautifully</li>
-<li>Save up coins to purchase seeds - they're worth the investment!</li>
-<li>Plan your garden layout before placing items</li>
-<li>Use paths to create beautiful walkways through your garden</li>
-<li>Try different themes to find your favorite aesthetic</li>
-</ul>
-
-<p><b>Happy Gardening!</b> 🌱🌳🌸</p>
-"""
-        
-        text_edit.setHtml(instructions)
+        text_edit.setDocument(_instructions_document())
         layout.addWidget(text_edit)
         
         # Add close button
@@ -454,7 +514,14 @@ class GardenDialog(QDialog):
         buttons.rejected.connect(instructions_dialog.reject)
         layout.addWidget(buttons)
         
-        instructions_dialog.exec()
+        return instructions_dialog
+
+    @pyqtSlot()
+    def _on_buy_clicked(self) -> None:
+        """Slot shared by the shop buttons."""
+        btn = self.sender()
+        if btn is not None:
+            self.on_purchase(btn.property("item"))
 
     def on_purchase(self, item: str) -> None:
         """Purchase an item with coins."""
@@ -464,15 +531,7 @@ class GardenDialog(QDialog):
 
     def on_mode_changed(self, index: int) -> None:
         """Handle aesthetic mode change."""
-        mode_map = {
-            0: "default",
-            1: "night",
-            2: "summer",
-            3: "winter",
-            4: "spring",
-            5: "autumn",
-        }
-        mode = mode_map.get(index, "default")
+        mode = _MODE_BY_INDEX[index] if 0 <= index < len(_MODE_BY_INDEX) else "default"
         
         # Check if theme is unlocked
         if not self.state.is_theme_unlocked(mode):
@@ -481,12 +540,20 @@ class GardenDialog(QDialog):
             self._refresh_mode_selector()
             return
         
+        if mode == self.state.get_aesthetic_mode():
+            return
         self.state.set_aesthetic_mode(mode)
-        # Force immediate refresh of both items and background
+        # Force immediate refresh of both items and background; this already
+        # invalidates the background layer and schedules the repaint.
         self.garden_view.refresh()
-        # Also force a viewport update to ensure background is redrawn
-        self.garden_view.viewport().update()
     
+    @pyqtSlot()
+    def _on_unlock_clicked(self) -> None:
+        """Slot shared by the theme unlock buttons."""
+        btn = self.sender()
+        if btn is not None:
+            self.on_unlock_theme(btn.property("theme"))
+
     def on_unlock_theme(self, mode: str) -> None:
         """Unlock a theme by spending coins."""
         success, message = self.state.unlock_theme(mode)
@@ -497,151 +564,149 @@ class GardenDialog(QDialog):
     # ------------------------------------------------------------------
     # Refresh / rendering
     # ------------------------------------------------------------------
+    def showEvent(self, event) -> None:
+        """Run any pending refresh before the dialog is first painted."""
+        if self._needs_refresh or self._refresh_timer.isActive():
+            self._refresh_timer.stop()
+            self._needs_refresh = False
+            self._do_refresh()
+        super().showEvent(event)
+
     def refresh(self) -> None:
+        """Schedule a refresh on the next event-loop pass (calls coalesce)."""
+
+        self._refresh_timer.start()
+
+    def _do_refresh(self) -> None:
         """Refresh inventory labels and garden tile representations."""
 
-        self._refresh_inventory()
-        self._refresh_buttons()
-        self._refresh_mode_selector()
-        self.garden_view.refresh()
-        
-        # Update watering mode button text if needed
-        if hasattr(self, '_watering_mode_active'):
+        # Nothing to show while hidden; showEvent catches up.
+        if not self.isVisible():
+            self._needs_refresh = True
+            return
+
+        # Hold repaints until every widget is updated, then paint once.
+        self.setUpdatesEnabled(False)
+        try:
+            # Query state once per refresh and hand the results down.
+            inv = self.state.get_inventory()
+            unlocked = self.state.get_unlocked_themes()
+            self._refresh_inventory(inv)
+            self._refresh_buttons(inv)
+            self._refresh_mode_selector(unlocked)
+            self.garden_view.refresh()
+        
+            # Update watering mode button text
             if self._watering_mode_active:
                 self.water_garden_btn.setText("Exit Watering")
             else:
                 self.water_garden_btn.setText("Water Garden")
         
-        # Update path placement mode button text if needed
-        if hasattr(self, '_path_placement_mode_active'):
+            # Update path placement mode button text
             if self._path_placement_mode_active:
                 self.place_path_btn.setText("Exit Path Placing")
             else:
                 self.place_path_btn.setText("Place Path")
         
-        # Update remove mode button text if needed
-        if hasattr(self, '_remove_mode_active'):
+            # Update remove mode button text
             if self._remove_mode_active:
                 self.remove_object_btn.setText("Exit Removing")
             else:
                 self.remove_object_btn.setText("Remove Object")
         
-        # Update mode indicator emoji
-        self._update_mode_indicator()
+            # Update mode indicator emoji
+            self._update_mode_indicator()
+        finally:
+            self.setUpdatesEnabled(True)
     
-    def _refresh_mode_selector(self) -> None:
+    def _refresh_mode_selector(self, unlocked: Optional[List[str]] = None) -> None:
         """Update the mode selector to reflect current state and unlock status."""
-        if not hasattr(self, 'mode_combo'):
-            return
-        
-        unlocked = self.state.get_unlocked_themes()
+        if unlocked is None:
+            unlocked = self.state.get_unlocked_themes()
         mode = self.state.get_aesthetic_mode()
-        mode_map = {
-            "default": 0,
-            "night": 1,
-            "summer": 2,
-            "winter": 3,
-            "spring": 4,
-            "autumn": 5,
-        }
         
         # Block signals to avoid triggering on_mode_changed
         self.mode_combo.blockSignals(True)
         
         # Update enabled state for each theme
-        for theme_mode, index in mode_map.items():
+        shown = self._combo_texts
+        for index, theme_mode in enumerate(_MODE_BY_INDEX):
             if theme_mode == "default":
                 # Default is always enabled
                 self.mode_combo.setItemData(index, None)  # Clear any disabled state
+                continue
+            if theme_mode in unlocked:
+                # Unlocked: enable and show normal text
+                self.mode_combo.setItemData(index, None)
+                text = _THEME_DISPLAY_NAMES[index]
             else:
-                if theme_mode in unlocked:
-                    # Unlocked: enable and show normal text
-                    self.mode_combo.setItemData(index, None)
-                    # Update text to remove lock indicator if present
-                    theme_names = ["Default", "Night Garden", "Summer Garden", "Winter Garden", "Spring Garden", "Autumn Garden"]
-                    self.mode_combo.setItemText(index, theme_names[index])
-                else:
-                    # Locked: disable and show lock indicator
-                    theme_names = ["Default", "Night Garden", "Summer Garden", "Winter Garden", "Spring Garden", "Autumn Garden"]
-                    self.mode_combo.setItemText(index, f"{theme_names[index]} 🔒")
-                    # Note: Qt ComboBox doesn't have a direct way to disable individual items
-                    # We'll handle this in on_mode_changed instead
+                # Locked: show lock indicator
+                # Note: Qt ComboBox doesn't have a direct way to disable individual items
+                # We'll handle this in on_mode_changed instead
+                text = f"{_THEME_DISPLAY_NAMES[index]} 🔒"
+            # Each setItemText is a model update; skip it when the text is unchanged
+            if shown[index] != text:
+                self.mode_combo.setItemText(index, text)
+                shown[index] = text
         
         # Set current index
-        index = mode_map.get(mode, 0)
+        index = _INDEX_BY_MODE.get(mode, 0)
         self.mode_combo.setCurrentIndex(index)
         self.mode_combo.blockSignals(False)
 
-    def _refresh_inventory(self) -> None:
-        inv = self.state.get_inventory()
+    def _refresh_inventory(self, inv: Dict[str, int]) -> None:
+        last = self._last_inv
         # Use emojis and bold labels for a more playful, readable inventory.
-        # Add spacing between distinct objects
-        self.water_label.setText(f"💧 <b>Water:</b> {inv['water']}")
-        self.plants_label.setText(f"🌱 <b>Plants:</b> {inv['plants']}")
-        self.trees_label.setText(f"🌳 <b>Trees:</b> {inv['trees']}")
-        self.sunlight_label.setText(f"☀️ <b>Sunlight:</b> {inv['sunlight']}")
-        self.coins_label.setText(f"🪙 <b>Coins:</b> {inv['coins']}")
-        self.seeds_label.setText(f"🌰 <b>Seeds:</b> {inv['seeds']}")
-        self.path_label.setText(f"🪨 <b>Paths:</b> {inv.get('path', 0)}")
-        
-        # Add spacing between inventory items
-        for label in [self.water_label, self.plants_label, self.trees_label, 
-                      self.sunlight_label, self.coins_label, self.seeds_label, self.path_label]:
-            label.setStyleSheet("font-size: 12pt; margin-right: 15px;")
+        # Only labels whose count changed are re-set (rich text is re-parsed).
+        for key, label, text in (
+            ("water", self.water_label, "💧 <b>Water:</b> {}"),
+            ("plants", self.plants_label, "🌱 <b>Plants:</b> {}"),
+            ("trees", self.trees_label, "🌳 <b>Trees:</b> {}"),
+            ("sunlight", self.sunlight_label, "☀️ <b>Sunlight:</b> {}"),
+            ("coins", self.coins_label, "🪙 <b>Coins:</b> {}"),
+            ("seeds", self.seeds_label, "🌰 <b>Seeds:</b> {}"),
+            ("path", self.path_label, "🪨 <b>Paths:</b> {}"),
+        ):
+            value = inv.get(key, 0)
+            if last.get(key) != value:
+                label.setText(text.format(value))
+                last[key] = value
 
     def _update_mode_indicator(self) -> None:
         """Update the emoji indicator based on active mode."""
-        if not hasattr(self, 'mode_indicator_label'):
-            return
-        
-        if hasattr(self, '_path_placement_mode_active') and self._path_placement_mode_active:
+        if self._path_placement_mode_active:
             self.mode_indicator_label.setText("🪨")
             self.mode_indicator_label.show()
-        elif hasattr(self, '_watering_mode_active') and self._watering_mode_active:
+        elif self._watering_mode_active:
             self.mode_indicator_label.setText("💧")
             self.mode_indicator_label.show()
-        elif hasattr(self, '_remove_mode_active') and self._remove_mode_active:
+        elif self._remove_mode_active:
             self.mode_indicator_label.setText("🗑️")
             self.mode_indicator_label.show()
         else:
             self.mode_indicator_label.setText("")
             self.mode_indicator_label.hide()
 
-    def _refresh_buttons(self) -> None:
-        inv = self.state.get_inventory()
-        unlocked = self.state.get_unlocked_themes()
-        
-        self.place_plant_btn.setEnabled(inv["plants"] > 0)
-        self.place_tree_btn.setEnabled(inv["trees"] > 0)
-        self.place_seed_btn.setEnabled(inv["seeds"] > 0)
-        self.place_path_btn.setEnabled(inv.get("path", 0) > 0)
-        self.water_garden_btn.setEnabled(inv["water"] > 0)
-        self.sunlight_btn.setEnabled(inv["sunlight"] > 0)
+    def _refresh_buttons(self, inv: Dict[str, int]) -> None:
+        # Action buttons need at least one of the item they use
+        for btn, key in (
+            (self.place_plant_btn, "plants"),
+            (self.place_tree_btn, "trees"),
+            (self.place_seed_btn, "seeds"),
+            (self.place_path_btn, "path"),
+            (self.water_garden_btn, "water"),
+            (self.sunlight_btn, "sunlight"),
+        ):
+            btn.setEnabled(inv.get(key, 0) > 0)
         
         # Enable shop buttons based on coin availability
-        self.buy_water_btn.setEnabled(inv["coins"] >= SHOP_PRICES["water"])
-        self.buy_plant_btn.setEnabled(inv["coins"] >= SHOP_PRICES["plants"])
-        self.buy_tree_btn.setEnabled(inv["coins"] >= SHOP_PRICES["trees"])
-        self.buy_sunlight_btn.setEnabled(inv["coins"] >= SHOP_PRICES["sunlight"])
-        self.buy_seed_btn.setEnabled(inv["coins"] >= SHOP_PRICES["seeds"])
-        self.buy_path_btn.setEnabled(inv["coins"] >= SHOP_PRICES["path"])
+        coins = inv["coins"]
+        for btn, price in self._buy_btn_prices:
+            btn.setEnabled(coins >= price)
         
         # Enable theme unlock buttons based on coin availability and unlock status
-        if hasattr(self, 'unlock_night_btn'):
-            self.unlock_night_btn.setEnabled(
-                inv["coins"] >= THEME_UNLOCK_PRICE and "night" not in unlocked
-            )
-            self.unlock_summer_btn.setEnabled(
-                inv["coins"] >= THEME_UNLOCK_PRICE and "summer" not in unlocked
-            )
-            self.unlock_winter_btn.setEnabled(
-                inv["coins"] >= THEME_UNLOCK_PRICE and "winter" not in unlocked
-            )
-            self.unlock_spring_btn.setEnabled(
-                inv["coins"] >= THEME_UNLOCK_PRICE and "spring" not in unlocked
-            )
-            self.unlock_autumn_btn.setEnabled(
-                inv["coins"] >= THEME_UNLOCK_PRICE and "autumn" not in unlocked
-            )
+        can_unlock = coins >= THEME_UNLOCK_PRICE
+        for theme, btn in self.unlock_btns.items():
+            btn.setEnabled(can_unlock and not self.state.is_theme_unlocked(theme))
 
 